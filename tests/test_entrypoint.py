@@ -0,0 +1,121 @@
+from unittest import mock
+
+import pytest
+
+from youtube_summarizer.cli import entrypoint
+from youtube_summarizer.types.video_usage_meta import VideoUsageMeta
+from youtube_summarizer.utils.model_limits import GPT_35_TURBO_TOKEN_LIMIT
+from youtube_summarizer.utils.tokenizer import get_tokenizer
+from youtube_summarizer.youtube_video_summarizer import (
+    DEFAULT_MIN_NEW_TOKENS,
+    SUMMARIZATION_SYSTEM_PROMPT,
+    YouTubeVideoSummarizer,
+)
+
+
+@pytest.mark.parametrize("flag", ["--batch", "--run-async", "--output-format=list"])
+def test_main_with_stream_rejects_flags_it_cannot_honor(flag: str) -> None:
+    with mock.patch(
+        "sys.argv",
+        ["summarize_video", "-v", "test_video_id", "-k", "test_api_key", "-s", flag],
+    ), pytest.raises(SystemExit):
+        entrypoint.main()
+
+
+@pytest.mark.parametrize(
+    ("model_name", "token_limit"),
+    [
+        ("gpt-4o-mini-2024-07-18", entrypoint.DEFAULT_CONTEXT_LENGTH),
+        ("gpt-3.5-turbo", GPT_35_TURBO_TOKEN_LIMIT),
+    ],
+)
+def test_main_without_context_length_caps_default_at_model_token_limit(
+    model_name: str,
+    token_limit: int,
+) -> None:
+    with mock.patch(
+        "sys.argv",
+        [
+            "summarize_video",
+            "-v",
+            "test_video_id",
+            "-k",
+            "test_api_key",
+            "-m",
+            model_name,
+        ],
+    ), mock.patch(
+        "youtube_summarizer.youtube_video_summarizer.YouTubeVideoSummarizer.summarize",
+        autospec=True,
+    ) as mock_summarize:
+        mock_summarize.return_value.meta = VideoUsageMeta(
+            prompt_tokens=0,
+            completion_tokens=0,
+        )
+        entrypoint.main()
+
+    summarizer: YouTubeVideoSummarizer = mock_summarize.call_args.args[0]
+    tokenizer = get_tokenizer(model_name)
+
+    assert summarizer._get_chunk_token_limit(detailed=False) == (  # noqa: SLF001
+        token_limit
+        - tokenizer.count_tokens(SUMMARIZATION_SYSTEM_PROMPT)
+        - DEFAULT_MIN_NEW_TOKENS
+    )
+
+
+def test_main_with_tokens_per_minute_requires_async() -> None:
+    with mock.patch(
+        "sys.argv",
+        [
+            "summarize_video",
+            "-v",
+            "test_video_id",
+            "-k",
+            "test_api_key",
+            "--tokens-per-minute",
+            "1000",
+        ],
+    ), pytest.raises(SystemExit):
+        entrypoint.main()
+
+
+@pytest.mark.parametrize("flag", ["--max-concurrency", "--tokens-per-minute"])
+def test_main_rejects_values_below_one(flag: str) -> None:
+    with mock.patch(
+        "sys.argv",
+        [
+            "summarize_video",
+            "-v",
+            "test_video_id",
+            "-k",
+            "test_api_key",
+            "-a",
+            flag,
+            "0",
+        ],
+    ), pytest.raises(SystemExit):
+        entrypoint.main()
+
+
+def test_main_rejects_batch_with_run_async() -> None:
+    with mock.patch(
+        "sys.argv",
+        ["summarize_video", "-v", "test_video_id", "-k", "test_api_key", "-b", "-a"],
+    ), pytest.raises(SystemExit):
+        entrypoint.main()
+
+
+def test_main_with_cache_closes_response_cache() -> None:
+    with mock.patch(
+        "sys.argv",
+        ["summarize_video", "-v", "test_video_id", "-k", "test_api_key", "--cache"],
+    ), mock.patch(
+        "youtube_summarizer.cli.entrypoint.ResponseCache",
+    ) as mock_response_cache, mock.patch(
+        "youtube_summarizer.youtube_video_summarizer.YouTubeVideoSummarizer.summarize",
+        side_effect=RuntimeError("Failed to summarize video"),
+    ), pytest.raises(RuntimeError, match="Failed to summarize video"):
+        entrypoint.main()
+
+    mock_response_cache.return_value.close.assert_called_once()
@@ -0,0 +1,23 @@
+import pytest
+
+from youtube_summarizer.utils.model_limits import (
+    GPT_4O_MINI_TOKEN_LIMIT,
+    GPT_35_TURBO_TOKEN_LIMIT,
+    get_model_token_limit,
+)
+
+
+@pytest.mark.parametrize(
+    ("model_name", "token_limit"),
+    [
+        ("gpt-3.5-turbo", GPT_35_TURBO_TOKEN_LIMIT),
+        ("gpt-4-32k-0613", 32768),
+        ("gpt-4o-mini-2024-07-18", GPT_4O_MINI_TOKEN_LIMIT),
+        ("unknown-model", GPT_4O_MINI_TOKEN_LIMIT),
+    ],
+)
+def test_get_model_token_limit_matches_longest_prefix(
+    model_name: str,
+    token_limit: int,
+) -> None:
+    assert get_model_token_limit(model_name) == token_limit
@@ -0,0 +1,327 @@
+import asyncio
+import json
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import openai
+import pytest
+
+from youtube_summarizer.clients.openai_client import (
+    ChatCompletionDelta,
+    OpenAIClient,
+    TextGenerationError,
+)
+from youtube_summarizer.utils.response_cache import ResponseCache
+
+if TYPE_CHECKING:
+    import aiohttp
+
+mocked_message: dict[str, str] = {"role": "assistant", "content": "Hello"}
+mocked_usage: dict[str, int] = {"prompt_tokens": 10, "completion_tokens": 20}
+mocked_response: dict = {
+    "choices": [{"message": mocked_message}],
+    "usage": mocked_usage,
+}
+
+
+async def generate_and_close(openai_client: OpenAIClient) -> tuple[dict, dict]:
+    async with openai_client:
+        return await openai_client.generate_chat_completion_async("user prompt")
+
+
+@pytest.fixture()
+def openai_client() -> OpenAIClient:
+    return OpenAIClient(api_key="test_api_key", max_retries=2)
+
+
+def test_generate_chat_completion_sends_system_prompt_first(
+    openai_client: OpenAIClient,
+) -> None:
+    with mock.patch(
+        "openai.ChatCompletion.create",
+        return_value=mocked_response,
+    ) as mock_create:
+        message, usage = openai_client.generate_chat_completion(
+            "user prompt",
+            system_prompt="system prompt",
+        )
+
+    assert message == mocked_message
+    assert usage == mocked_usage
+    assert mock_create.call_args.kwargs["messages"] == [
+        {"role": "system", "content": "system prompt"},
+        {"role": "user", "content": "user prompt"},
+    ]
+
+
+def test_generate_chat_completion_retries_when_rate_limited(
+    openai_client: OpenAIClient,
+) -> None:
+    with mock.patch(
+        "openai.ChatCompletion.create",
+        side_effect=[openai.error.RateLimitError("Slow down"), mocked_response],
+    ) as mock_create, mock.patch("time.sleep") as mock_sleep:
+        message, _ = openai_client.generate_chat_completion("user prompt")
+
+    assert message == mocked_message
+    assert mock_create.call_count == 2  # noqa: PLR2004
+    mock_sleep.assert_called_once()
+
+
+def test_generate_chat_completion_raises_after_max_retries(
+    openai_client: OpenAIClient,
+) -> None:
+    with mock.patch(
+        "openai.ChatCompletion.create",
+        side_effect=openai.error.RateLimitError("Slow down"),
+    ) as mock_create, mock.patch("time.sleep"), pytest.raises(
+        openai.error.RateLimitError,
+    ):
+        openai_client.generate_chat_completion("user prompt")
+
+    assert mock_create.call_count == 3  # noqa: PLR2004
+
+
+def test_generate_chat_completion_async_retries_when_rate_limited(
+    openai_client: OpenAIClient,
+) -> None:
+    with mock.patch(
+        "openai.ChatCompletion.acreate",
+        new_callable=mock.AsyncMock,
+        side_effect=[openai.error.RateLimitError("Slow down"), mocked_response],
+    ) as mock_acreate, mock.patch("asyncio.sleep", new_callable=mock.AsyncMock):
+        message, _ = asyncio.run(generate_and_close(openai_client))
+
+    assert message == mocked_message
+    assert mock_acreate.await_count == 2  # noqa: PLR2004
+
+
+def test_generate_chat_completions_batch_returns_results_in_prompt_order(
+    openai_client: OpenAIClient,
+) -> None:
+    output_lines: list[str] = [
+        json.dumps(
+            {
+                "custom_id": str(index),
+                "response": {
+                    "status_code": 200,
+                    "body": {
+                        "choices": [{"message": {"content": f"summary {index}"}}],
+                        "usage": mocked_usage,
+                    },
+                },
+            },
+        )
+        for index in (1, 0)
+    ]
+
+    with mock.patch(
+        "openai.File.create",
+        return_value={"id": "file_id"},
+    ) as mock_file_create, mock.patch(
+        "youtube_summarizer.clients.openai_client.Batch.create",
+        return_value={"id": "batch_id", "status": "in_progress"},
+    ), mock.patch(
+        "youtube_summarizer.clients.openai_client.Batch.retrieve",
+        return_value={
+            "id": "batch_id",
+            "status": "completed",
+            "output_file_id": "output_file_id",
+        },
+    ), mock.patch(
+        "openai.File.download",
+        return_value="\n".join(output_lines).encode(),
+    ), mock.patch("time.sleep"):
+        results = openai_client.generate_chat_completions_batch(
+            ["chunk 0", "chunk 1"],
+            system_prompt="system prompt",
+        )
+
+    uploaded_lines: list[str] = (
+        mock_file_create.call_args.kwargs["file"].getvalue().decode().splitlines()
+    )
+
+    assert [json.loads(line)["custom_id"] for line in uploaded_lines] == ["0", "1"]
+    assert [message["content"] for message, _ in results] == [
+        "summary 0",
+        "summary 1",
+    ]
+
+
+def test_generate_chat_completions_batch_with_failed_batch_raises_error(
+    openai_client: OpenAIClient,
+) -> None:
+    with mock.patch(
+        "openai.File.create",
+        return_value={"id": "file_id"},
+    ), mock.patch(
+        "youtube_summarizer.clients.openai_client.Batch.create",
+        return_value={"id": "batch_id", "status": "failed"},
+    ), pytest.raises(TextGenerationError, match="failed"):
+        openai_client.generate_chat_completions_batch(["chunk 0"])
+
+
+def test_generate_chat_completion_with_cache_calls_api_once(tmp_path: Path) -> None:
+    openai_client = OpenAIClient(
+        api_key="test_api_key",
+        response_cache=ResponseCache(tmp_path / "responses.sqlite3"),
+    )
+
+    with mock.patch(
+        "openai.ChatCompletion.create",
+        return_value=mocked_response,
+    ) as mock_create:
+        openai_client.generate_chat_completion("user prompt")
+        message, usage = openai_client.generate_chat_completion("user prompt")
+
+    mock_create.assert_called_once()
+    assert message["content"] == mocked_message["content"]
+    assert usage["prompt_tokens"] == 0
+    assert usage["completion_tokens"] == 0
+
+
+def test_generate_chat_completion_async_reuses_session(
+    openai_client: OpenAIClient,
+) -> None:
+    sessions: list[object] = []
+
+    async def acreate(**_: object) -> dict:
+        sessions.append(openai.aiosession.get())
+        return mocked_response
+
+    async def generate_twice() -> None:
+        await openai_client.generate_chat_completion_async("user prompt")
+        await asyncio.create_task(
+            openai_client.generate_chat_completion_async("user prompt"),
+        )
+        await openai_client.aclose()
+
+    with mock.patch("openai.ChatCompletion.acreate", side_effect=acreate):
+        asyncio.run(generate_twice())
+
+    assert sessions[0] is not None
+    assert sessions[0] is sessions[1]
+
+
+def test_generate_chat_completion_async_with_cache_calls_api_once(
+    tmp_path: Path,
+) -> None:
+    openai_client = OpenAIClient(
+        api_key="test_api_key",
+        response_cache=ResponseCache(tmp_path / "responses.sqlite3"),
+    )
+
+    async def generate_twice() -> tuple[dict, dict]:
+        await openai_client.generate_chat_completion_async("user prompt")
+        response = await openai_client.generate_chat_completion_async("user prompt")
+        await openai_client.aclose()
+        return response
+
+    with mock.patch(
+        "openai.ChatCompletion.acreate",
+        new_callable=mock.AsyncMock,
+        return_value=mocked_response,
+    ) as mock_acreate:
+        message, usage = asyncio.run(generate_twice())
+
+    mock_acreate.assert_awaited_once()
+    assert message["content"] == mocked_message["content"]
+    assert usage["prompt_tokens"] == 0
+
+
+def test_async_context_manager_closes_session(openai_client: OpenAIClient) -> None:
+    sessions: list[aiohttp.ClientSession] = []
+
+    async def acreate(**_: object) -> dict:
+        sessions.append(openai.aiosession.get())
+        return mocked_response
+
+    with mock.patch("openai.ChatCompletion.acreate", side_effect=acreate):
+        asyncio.run(generate_and_close(openai_client))
+
+    assert sessions[0].closed
+
+
+def test_stream_chat_completion_async_yields_deltas_and_usage(
+    openai_client: OpenAIClient,
+) -> None:
+    async def response_stream() -> AsyncGenerator[dict, None]:
+        for content in ("Hel", "lo"):
+            yield {"choices": [{"delta": {"content": content}}], "usage": None}
+
+        yield {"choices": [], "usage": mocked_usage}
+
+    async def collect() -> list[ChatCompletionDelta]:
+        async with openai_client:
+            return [
+                delta
+                async for delta in openai_client.stream_chat_completion_async(
+                    "user prompt",
+                )
+            ]
+
+    with mock.patch(
+        "openai.ChatCompletion.acreate",
+        new_callable=mock.AsyncMock,
+        return_value=response_stream(),
+    ) as mock_acreate:
+        deltas = asyncio.run(collect())
+
+    assert mock_acreate.call_args.kwargs["stream"] is True
+    assert deltas == [
+        ChatCompletionDelta("Hel"),
+        ChatCompletionDelta("lo"),
+        ChatCompletionDelta("", mocked_usage),
+    ]
+
+
+def test_generate_chat_completion_retries_server_errors_after_retry_after(
+    openai_client: OpenAIClient,
+) -> None:
+    server_error = openai.error.APIError(
+        "Server error",
+        http_status=500,
+        headers={"Retry-After": "3"},
+    )
+
+    with mock.patch(
+        "openai.ChatCompletion.create",
+        side_effect=[server_error, mocked_response],
+    ) as mock_create, mock.patch("time.sleep") as mock_sleep:
+        message, _ = openai_client.generate_chat_completion("user prompt")
+
+    assert message == mocked_message
+    assert mock_create.call_count == 2  # noqa: PLR2004
+    mock_sleep.assert_called_once_with(3.0)
+
+
+def test_generate_chat_completion_does_not_retry_client_errors(
+    openai_client: OpenAIClient,
+) -> None:
+    with mock.patch(
+        "openai.ChatCompletion.create",
+        side_effect=openai.error.APIError("Bad request", http_status=418),
+    ) as mock_create, mock.patch("time.sleep"), pytest.raises(openai.error.APIError):
+        openai_client.generate_chat_completion("user prompt")
+
+    mock_create.assert_called_once()
+
+
+def test_generate_chat_completion_async_closes_session_of_previous_loop(
+    openai_client: OpenAIClient,
+) -> None:
+    sessions: list[aiohttp.ClientSession] = []
+
+    async def acreate(**_: object) -> dict:
+        sessions.append(openai.aiosession.get())
+        return mocked_response
+
+    with mock.patch("openai.ChatCompletion.acreate", side_effect=acreate):
+        # The first loop ends without closing the client.
+        asyncio.run(openai_client.generate_chat_completion_async("user prompt"))
+        asyncio.run(generate_and_close(openai_client))
+
+    assert sessions[0] is not sessions[1]
+    assert sessions[0].closed
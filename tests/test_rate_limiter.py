@@ -0,0 +1,53 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from youtube_summarizer.utils.rate_limiter import TokenRateLimiter
+
+
+def test_init_with_invalid_tokens_per_minute_raises_value_error() -> None:
+    with pytest.raises(ValueError, match="tokens_per_minute"):
+        TokenRateLimiter(0)
+
+
+def test_acquire_waits_for_tokens_to_refill() -> None:
+    now: list[float] = [0.0]
+
+    async def sleep(seconds: float) -> None:
+        now[0] += seconds
+
+    with mock.patch(
+        "youtube_summarizer.utils.rate_limiter.time.monotonic",
+        side_effect=lambda: now[0],
+    ), mock.patch(
+        "youtube_summarizer.utils.rate_limiter.asyncio.sleep",
+        side_effect=sleep,
+    ) as mock_sleep:
+        limiter = TokenRateLimiter(60)
+        asyncio.run(limiter.acquire(60))
+        mock_sleep.assert_not_called()
+
+        asyncio.run(limiter.acquire(30))
+
+    assert now[0] == pytest.approx(30.0)
+
+
+def test_acquire_with_more_tokens_than_capacity_waits_for_full_bucket() -> None:
+    now: list[float] = [0.0]
+
+    async def sleep(seconds: float) -> None:
+        now[0] += seconds
+
+    with mock.patch(
+        "youtube_summarizer.utils.rate_limiter.time.monotonic",
+        side_effect=lambda: now[0],
+    ), mock.patch(
+        "youtube_summarizer.utils.rate_limiter.asyncio.sleep",
+        side_effect=sleep,
+    ):
+        limiter = TokenRateLimiter(60)
+        asyncio.run(limiter.acquire(10))
+        asyncio.run(limiter.acquire(1000))
+
+    assert now[0] == pytest.approx(10.0)
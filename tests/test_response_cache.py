@@ -0,0 +1,38 @@
+from pathlib import Path
+
+from youtube_summarizer.utils.response_cache import ResponseCache
+
+
+def make_key(user_prompt: str) -> str:
+    return ResponseCache.make_key(
+        model="gpt-4o-mini",
+        system_prompt="system prompt",
+        temperature=0.1,
+        user_prompt=user_prompt,
+    )
+
+
+def test_get_without_cached_response_returns_none(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path / "responses.sqlite3")
+    assert cache.get(make_key("chunk")) is None
+
+
+def test_set_persists_response_across_instances(tmp_path: Path) -> None:
+    path: Path = tmp_path / "responses.sqlite3"
+    cache = ResponseCache(path)
+    cache.set(make_key("chunk"), "summary")
+    cache.close()
+
+    assert ResponseCache(path).get(make_key("chunk")) == "summary"
+
+
+def test_make_key_depends_on_every_parameter() -> None:
+    key: str = make_key("chunk")
+
+    assert key != make_key("other chunk")
+    assert key != ResponseCache.make_key(
+        model="gpt-4o-mini",
+        system_prompt="system prompt",
+        temperature=0.5,
+        user_prompt="chunk",
+    )
@@ -0,0 +1,21 @@
+import pytest
+import tiktoken
+
+from youtube_summarizer.utils.tokenizer import Tokenizer
+
+
+@pytest.fixture(scope="module")
+def tokenizer() -> Tokenizer:
+    return Tokenizer(tiktoken.get_encoding("cl100k_base"))
+
+
+def test_count_tokens_batch_matches_count_tokens(tokenizer: Tokenizer) -> None:
+    texts: list[str] = ["Hello world", " again", ""]
+
+    assert tokenizer.count_tokens_batch(texts) == [
+        tokenizer.count_tokens(text) for text in texts
+    ]
+
+
+def test_count_tokens_counts_special_tokens_as_text(tokenizer: Tokenizer) -> None:
+    assert tokenizer.count_tokens("<|endoftext|>") > 0
@@ -1,18 +1,23 @@
 from typing import TYPE_CHECKING
 
+import pytest
 import tiktoken
 
-from youtube_summarizer.video_transcript import VideoTranscript
 from youtube_summarizer.utils.tokenizer import Tokenizer
+from youtube_summarizer.video_transcript import VideoTranscript
 
 if TYPE_CHECKING:
     from collections.abc import Generator
 
 
-def test_get_chunks_returns_expected_chunk_length() -> None:
+@pytest.fixture(scope="module")
+def encoding() -> tiktoken.Encoding:
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def test_get_chunks_returns_expected_chunk_length(encoding: tiktoken.Encoding) -> None:
     transcript_strs: list[str] = ["Hello", "world"]
     transcript = VideoTranscript(transcript_strs)
-    encoding: tiktoken.Encoding = tiktoken.get_encoding("cl100k_base")
     tokenizer = Tokenizer(encoding)
     chunks: Generator[str, None, None] = transcript.get_chunks(2, tokenizer=tokenizer)
     chunks_list = list(chunks)
@@ -20,10 +25,9 @@ def test_get_chunks_returns_expected_chunk_length() -> None:
     assert len(chunks_list) == len(transcript_strs)
 
 
-def test_get_chunks_returns_expected_chunk_content() -> None:
+def test_get_chunks_returns_expected_chunk_content(encoding: tiktoken.Encoding) -> None:
     transcript_strs: list[str] = ["Hello", "world"]
     transcript = VideoTranscript(transcript_strs)
-    encoding: tiktoken.Encoding = tiktoken.get_encoding("cl100k_base")
     tokenizer = Tokenizer(encoding)
     chunks: Generator[str, None, None] = transcript.get_chunks(2, tokenizer=tokenizer)
     chunks_list = list(chunks)
@@ -31,10 +35,11 @@ def test_get_chunks_returns_expected_chunk_content() -> None:
     assert "".join(chunks_list) == " ".join(transcript_strs)
 
 
-def test_get_chunks_with_high_context_length_returns_one_chunk() -> None:
+def test_get_chunks_with_high_context_length_returns_one_chunk(
+    encoding: tiktoken.Encoding,
+) -> None:
     transcript_strs: list[str] = ["Hello", "world"]
     transcript = VideoTranscript(transcript_strs)
-    encoding: tiktoken.Encoding = tiktoken.get_encoding("cl100k_base")
     tokenizer = Tokenizer(encoding)
     chunks: Generator[str, None, None] = transcript.get_chunks(10, tokenizer=tokenizer)
     chunks_list = list(chunks)
@@ -42,14 +47,48 @@ def test_get_chunks_with_high_context_length_returns_one_chunk() -> None:
     assert len(chunks_list) == 1
 
 
-def test_get_chunks_with_high_context_length_returns_one_chunk_with_all_content() -> (
-    None
-):
+def test_get_chunks_with_high_context_length_returns_one_chunk_with_all_content(
+    encoding: tiktoken.Encoding,
+) -> None:
     transcript_strs: list[str] = ["Hello", "world"]
     transcript = VideoTranscript(transcript_strs)
-    encoding: tiktoken.Encoding = tiktoken.get_encoding("cl100k_base")
     tokenizer = Tokenizer(encoding)
     chunks: Generator[str, None, None] = transcript.get_chunks(10, tokenizer=tokenizer)
     chunks_list = list(chunks)
 
     assert " ".join(chunks_list) == " ".join(transcript_strs)
+
+
+def test_get_chunks_with_oversized_first_line_does_not_return_empty_chunk(
+    encoding: tiktoken.Encoding,
+) -> None:
+    transcript_strs: list[str] = ["Hello world again", "world"]
+    transcript = VideoTranscript(transcript_strs)
+    tokenizer = Tokenizer(encoding)
+    chunks: Generator[str, None, None] = transcript.get_chunks(2, tokenizer=tokenizer)
+    chunks_list = list(chunks)
+
+    assert "" not in chunks_list
+    assert chunks_list == ["Hello", " world", " again", " world"]
+
+
+def test_get_chunks_splits_oversized_line_at_sentence_boundaries(
+    encoding: tiktoken.Encoding,
+) -> None:
+    transcript = VideoTranscript(["One two. Three four. Five six.", "Seven"])
+    tokenizer = Tokenizer(encoding)
+    chunks: list[str] = list(transcript.get_chunks(6, tokenizer=tokenizer))
+
+    assert "".join(chunks) == "One two. Three four. Five six. Seven"
+    assert all(tokenizer.count_tokens(chunk) < 6 for chunk in chunks)  # noqa: PLR2004
+
+
+def test_get_chunks_splits_oversized_sentence_between_words(
+    encoding: tiktoken.Encoding,
+) -> None:
+    transcript = VideoTranscript(["one two three four five six"])
+    tokenizer = Tokenizer(encoding)
+    chunks: list[str] = list(transcript.get_chunks(4, tokenizer=tokenizer))
+
+    assert "".join(chunks) == "one two three four five six"
+    assert all(tokenizer.count_tokens(chunk) < 4 for chunk in chunks)  # noqa: PLR2004
@@ -13,3 +13,15 @@ def test_query_string_dict_returns_expected_values() -> None:
     parser = URLParser(url)
     result: dict = parser.query_string_dict()
     assert result == {"v": "12345"}
+
+
+def test_video_id_returns_expected_value() -> None:
+    url = "https://www.youtube.com/watch?feature=share&v=12345#t=10"
+    parser = URLParser(url)
+    assert parser.video_id() == "12345"
+
+
+def test_video_id_without_video_parameter_returns_none() -> None:
+    url = "https://www.youtube.com/watch?referrer=jake&vv=12345"
+    parser = URLParser(url)
+    assert parser.video_id() is None
@@ -0,0 +1,48 @@
+from collections.abc import Generator
+from unittest import mock
+
+import pytest
+import tiktoken
+
+from youtube_summarizer.clients import youtube_transcript_client
+from youtube_summarizer.clients.youtube_transcript_client import (
+    YouTubeTranscriptClient,
+)
+from youtube_summarizer.utils.tokenizer import Tokenizer
+
+mocked_transcript: list[dict] = [
+    {"text": "Hello", "start": 0.0, "duration": 1.0},
+    {"text": "world", "start": 1.0, "duration": 1.0},
+]
+
+
+@pytest.fixture()
+def mock_get_transcript() -> Generator[mock.MagicMock, None, None]:
+    youtube_transcript_client._fetch_transcript_lines.cache_clear()  # noqa: SLF001
+
+    with mock.patch(
+        "youtube_summarizer.clients.youtube_transcript_client.YouTubeTranscriptApi.get_transcript",
+        return_value=mocked_transcript,
+    ) as mock_get_transcript:
+        yield mock_get_transcript
+
+    youtube_transcript_client._fetch_transcript_lines.cache_clear()  # noqa: SLF001
+
+
+def test_get_transcript_returns_transcript_lines(
+    mock_get_transcript: mock.MagicMock,
+) -> None:
+    transcript = YouTubeTranscriptClient.get_transcript("test_video_id")
+    tokenizer = Tokenizer(tiktoken.get_encoding("cl100k_base"))
+
+    mock_get_transcript.assert_called_once_with("test_video_id")
+    assert list(transcript.get_chunks(100, tokenizer=tokenizer)) == ["Hello world"]
+
+
+def test_get_transcript_fetches_each_video_once(
+    mock_get_transcript: mock.MagicMock,
+) -> None:
+    YouTubeTranscriptClient.get_transcript("test_video_id")
+    YouTubeTranscriptClient.get_transcript("test_video_id")
+
+    mock_get_transcript.assert_called_once_with("test_video_id")
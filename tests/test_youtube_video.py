@@ -43,3 +43,22 @@ def test_non_string_value_raises_type_error() -> None:
     url = 12345
     with pytest.raises(TypeError, match="Expected string value for video URL or ID"):
         YouTubeVideo(url)  # type: ignore
+
+
+def test_parses_id_from_url_with_other_query_parameters() -> None:
+    url = "https://www.youtube.com/watch?feature=share&v=abc_-123#t=10"
+    parser = YouTubeVideo(url)
+    assert parser.id == "abc_-123"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://youtu.be/dQw4w9WgXcQ?t=10",
+        "https://www.youtube.com/embed/dQw4w9WgXcQ",
+        "https://www.youtube.com/shorts/dQw4w9WgXcQ?feature=share",
+    ],
+)
+def test_parses_id_from_short_embed_and_shorts_urls(url: str) -> None:
+    parser = YouTubeVideo(url)
+    assert parser.id == "dQw4w9WgXcQ"
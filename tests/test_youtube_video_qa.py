@@ -0,0 +1,77 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from youtube_summarizer.youtube_video import YouTubeVideo
+from youtube_summarizer.youtube_video_qa import ANSWER_NOT_FOUND, YouTubeVideoQA
+
+mocked_usage: dict[str, int] = {"prompt_tokens": 10, "completion_tokens": 20}
+
+
+@pytest.fixture()
+def mocked_youtube_video() -> YouTubeVideo:
+    return YouTubeVideo(video_url_or_id="test_video_id")
+
+
+def test_init_with_invalid_max_concurrency_raises_error() -> None:
+    with pytest.raises(ValueError, match="max_concurrency"):
+        YouTubeVideoQA(mock.Mock(), max_concurrency=0)
+
+
+def test_answer_question_async_stops_after_first_answer(
+    mocked_youtube_video: YouTubeVideo,
+) -> None:
+    async def generate_chat_completion_async(
+        user_prompt: str,
+        **_: object,
+    ) -> tuple[dict, dict]:
+        if "chunk2" in user_prompt:
+            return {"content": "The answer"}, mocked_usage
+
+        # Never finish so the pending check has to be cancelled.
+        await asyncio.sleep(0 if "chunk1" in user_prompt else 60)
+        return {"content": ANSWER_NOT_FOUND}, mocked_usage
+
+    client = mock.Mock()
+    client.generate_chat_completion_async = mock.AsyncMock(
+        side_effect=generate_chat_completion_async,
+    )
+
+    with mock.patch(
+        "youtube_summarizer.clients.youtube_transcript_client.YouTubeTranscriptClient.get_transcript",
+    ) as mock_transcript:
+        mock_transcript.return_value = mock.Mock(
+            get_chunks=mock.Mock(return_value=["chunk1", "chunk2", "chunk3"]),
+        )
+        qa = YouTubeVideoQA(client)
+        response = asyncio.run(
+            qa.answer_question_async(mocked_youtube_video, "What is it?"),
+        )
+
+    assert response.answer == "The answer"
+    assert response.meta.prompt_tokens <= 2 * mocked_usage["prompt_tokens"]
+
+
+def test_answer_question_async_without_answer_returns_none(
+    mocked_youtube_video: YouTubeVideo,
+) -> None:
+    client = mock.Mock()
+    client.generate_chat_completion_async = mock.AsyncMock(
+        return_value=({"content": ANSWER_NOT_FOUND}, mocked_usage),
+    )
+
+    with mock.patch(
+        "youtube_summarizer.clients.youtube_transcript_client.YouTubeTranscriptClient.get_transcript",
+    ) as mock_transcript:
+        mock_transcript.return_value = mock.Mock(
+            get_chunks=mock.Mock(return_value=["chunk1", "chunk2"]),
+        )
+        qa = YouTubeVideoQA(client)
+        response = asyncio.run(
+            qa.answer_question_async(mocked_youtube_video, "What is it?"),
+        )
+
+    assert response.answer is None
+    assert response.meta.prompt_tokens == 2 * mocked_usage["prompt_tokens"]
+    assert response.meta.completion_tokens == 2 * mocked_usage["completion_tokens"]
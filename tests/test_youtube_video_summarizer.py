@@ -1,17 +1,20 @@
+import asyncio
+from collections.abc import AsyncGenerator, Generator
 from unittest import mock
 
 import pytest
 
+from youtube_summarizer.clients.openai_client import ChatCompletionDelta
+from youtube_summarizer.utils.tokenizer import get_tokenizer
 from youtube_summarizer.youtube_video import YouTubeVideo
 from youtube_summarizer.youtube_video_summarizer import (
+    SUMMARIZATION_SYSTEM_PROMPT,
+    SummaryDelta,
     VideoSummarizationBulletedList,
     VideoSummarizationList,
     YouTubeVideoSummarizer,
 )
 
-# Mock the YouTubeVideo class.
-mocked_youtube_video = YouTubeVideo(video_url_or_id="test_video_id")
-
 mock_summary: str = """
 - This is a summary
 - This is another summary
@@ -29,6 +32,11 @@ mocked_response: dict[str, str] = {"content": "This is a summarized content"}
 mocked_usage: dict[str, int] = {"prompt_tokens": 10, "completion_tokens": 20}
 
 
+@pytest.fixture(scope="session")
+def mocked_youtube_video() -> YouTubeVideo:
+    return YouTubeVideo(video_url_or_id="test_video_id")
+
+
 @pytest.fixture()
 def open_ai_client() -> mock.MagicMock:
     return mock.MagicMock()
@@ -43,7 +51,14 @@ def test_init_does_not_throw(youtube_video_summarizer: YouTubeVideoSummarizer) -
     assert youtube_video_summarizer
 
 
-def test_summarize_returns_tuple() -> None:
+def test_summarizer_does_not_accept_new_attributes(
+    youtube_video_summarizer: YouTubeVideoSummarizer,
+) -> None:
+    with pytest.raises(AttributeError):
+        youtube_video_summarizer.video_id = "test_video_id"  # type: ignore[attr-defined]
+
+
+def test_summarize_returns_tuple(mocked_youtube_video: YouTubeVideo) -> None:
     with mock.patch(
         "youtube_summarizer.clients.youtube_transcript_client.YouTubeTranscriptClient.get_transcript",
     ) as mock_transcript, mock.patch(
@@ -61,7 +76,9 @@ def test_summarize_returns_tuple() -> None:
         assert isinstance(summarization, tuple)
 
 
-def test_summarize_returns_tuple_of_expected_values() -> None:
+def test_summarize_returns_tuple_of_expected_values(
+    mocked_youtube_video: YouTubeVideo,
+) -> None:
     mock_chunks: list[str] = ["chunk1", "chunk2"]
 
     with mock.patch(
@@ -89,7 +106,9 @@ def test_summarize_returns_tuple_of_expected_values() -> None:
     )
 
 
-def test_summarize_with_no_format_returns_list_object() -> None:
+def test_summarize_with_no_format_returns_list_object(
+    mocked_youtube_video: YouTubeVideo,
+) -> None:
     mock_chunks: list[str] = ["chunk1", "chunk2"]
 
     with mock.patch(
@@ -109,7 +128,9 @@ def test_summarize_with_no_format_returns_list_object() -> None:
     assert isinstance(summarization, VideoSummarizationList)
 
 
-def test_summarize_with_bulleted_list_format_returns_expected_str_summary() -> None:
+def test_summarize_with_bulleted_list_format_returns_expected_str_summary(
+    mocked_youtube_video: YouTubeVideo,
+) -> None:
     mock_chunks: list[str] = ["chunk1", "chunk2"]
 
     with mock.patch(
@@ -140,7 +161,9 @@ def test_summarize_with_bulleted_list_format_returns_expected_str_summary() -> N
     )
 
 
-def test_summarize_with_bulleted_list_format_returns_expected_object() -> None:
+def test_summarize_with_bulleted_list_format_returns_expected_object(
+    mocked_youtube_video: YouTubeVideo,
+) -> None:
     mock_chunks: list[str] = ["chunk1", "chunk2"]
 
     with mock.patch(
@@ -165,6 +188,526 @@ def test_summarize_with_bulleted_list_format_returns_expected_object() -> None:
 
 def test_summarize_with_invalid_output_format_raises_value_error(
     youtube_video_summarizer: YouTubeVideoSummarizer,
+    mocked_youtube_video: YouTubeVideo,
 ) -> None:
     with pytest.raises(ValueError, match="Invalid output format"):
         youtube_video_summarizer.summarize(mocked_youtube_video, output_format="bad")
+
+
+def test_summarize_async_returns_tuple_of_expected_values(
+    mocked_youtube_video: YouTubeVideo,
+) -> None:
+    mock_chunks: list[str] = ["chunk1", "chunk2", "chunk3"]
+
+    with mock.patch(
+        "youtube_summarizer.clients.youtube_transcript_client.YouTubeTranscriptClient.get_transcript",
+    ) as mock_transcript, mock.patch(
+        "youtube_summarizer.youtube_video_summarizer.YouTubeVideoSummarizer._summarize_chunk_async",
+        new_callable=mock.AsyncMock,
+    ) as mock_chunk:
+        # Mock transcript response and chunk summarization
+        mock_transcript.return_value = mock.Mock(
+            get_chunks=mock.Mock(return_value=mock_chunks),
+        )
+        mock_chunk.return_value = (mock_summary, mocked_usage)
+        client = mock.Mock()
+        summarizer = YouTubeVideoSummarizer(openai_client=client, max_concurrency=2)
+        summarization = asyncio.run(summarizer.summarize_async(mocked_youtube_video))
+
+    num_chunks: int = len(mock_chunks)
+
+    assert mock_chunk.await_count == num_chunks
+    assert summarization.summary == (mock_summary_list * num_chunks)
+    assert summarization.meta.prompt_tokens == (
+        mocked_usage["prompt_tokens"] * num_chunks
+    )
+
+
+def test_init_with_invalid_max_concurrency_raises_value_error() -> None:
+    with pytest.raises(ValueError, match="max_concurrency"):
+        YouTubeVideoSummarizer(mock.Mock(), max_concurrency=0)
+
+
+def test_summarize_async_keeps_chunk_order(mocked_youtube_video: YouTubeVideo) -> None:
+    mock_chunks: list[str] = ["chunk1", "chunk2", "chunk3"]
+
+    async def summarize_chunk(chunk: str, **_: object) -> tuple[str, dict]:
+        # Finish the chunks in reverse order.
+        await asyncio.sleep(0.01 * (len(mock_chunks) - mock_chunks.index(chunk)))
+        return f"- {chunk}", mocked_usage
+
+    with mock.patch(
+        "youtube_summarizer.clients.youtube_transcript_client.YouTubeTranscriptClient.get_transcript",
+    ) as mock_transcript, mock.patch(
+        "youtube_summarizer.youtube_video_summarizer.YouTubeVideoSummarizer._summarize_chunk_async",
+        side_effect=summarize_chunk,
+    ):
+        mock_transcript.return_value = mock.Mock(
+            get_chunks=mock.Mock(return_value=mock_chunks),
+        )
+        client = mock.Mock()
+        summarizer = YouTubeVideoSummarizer(openai_client=client)
+        summarization = asyncio.run(summarizer.summarize_async(mocked_youtube_video))
+
+    assert summarization.summary == mock_chunks
+
+
+def test_summarize_strips_alternate_bullet_markers(
+    mocked_youtube_video: YouTubeVideo,
+) -> None:
+    with mock.patch(
+        "youtube_summarizer.clients.youtube_transcript_client.YouTubeTranscriptClient.get_transcript",
+    ) as mock_transcript, mock.patch(
+        "youtube_summarizer.youtube_video_summarizer.YouTubeVideoSummarizer._summarize_chunk",
+    ) as mock_chunk:
+        mock_transcript.return_value = mock.Mock(
+            get_chunks=mock.Mock(return_value=["chunk1"]),
+        )
+        mock_chunk.return_value = (
+            "* This is a summary\n  - This is another summary\n-5 degrees",
+            mocked_usage,
+        )
+        client = mock.Mock()
+        summarizer = YouTubeVideoSummarizer(openai_client=client)
+        summarization = summarizer.summarize(mocked_youtube_video)
+
+    assert summarization.summary == [
+        "This is a summary",
+        "This is another summary",
+        "-5 degrees",
+    ]
+
+
+def test_summarize_batch_returns_tuple_of_expected_values(
+    mocked_youtube_video: YouTubeVideo,
+) -> None:
+    mock_chunks: list[str] = ["chunk1", "chunk2"]
+
+    with mock.patch(
+        "youtube_summarizer.clients.youtube_transcript_client.YouTubeTranscriptClient.get_transcript",
+    ) as mock_transcript:
+        mock_transcript.return_value = mock.Mock(
+            get_chunks=mock.Mock(return_value=iter(mock_chunks)),
+        )
+        client = mock.Mock()
+        client.generate_chat_completions_batch.return_value = [
+            ({"content": mock_summary}, mocked_usage) for _ in mock_chunks
+        ]
+        summarizer = YouTubeVideoSummarizer(openai_client=client)
+        summarization = summarizer.summarize_batch(mocked_youtube_video)
+
+    num_chunks: int = len(mock_chunks)
+
+    assert client.generate_chat_completions_batch.call_args.args[0] == mock_chunks
+    assert summarization.summary == (mock_summary_list * num_chunks)
+    assert summarization.meta.completion_tokens == (
+        mocked_usage["completion_tokens"] * num_chunks
+    )
+
+
+def test_summarize_stream_async_yields_chunks_in_order(
+    mocked_youtube_video: YouTubeVideo,
+) -> None:
+    mock_chunks: list[str] = ["chunk1", "chunk2", "chunk3"]
+
+    async def summarize_chunk(chunk: str, **_: object) -> tuple[str, dict]:
+        # Finish the chunks in reverse order.
+        await asyncio.sleep(0.01 * (len(mock_chunks) - mock_chunks.index(chunk)))
+        return chunk, mocked_usage
+
+    async def collect(summarizer: YouTubeVideoSummarizer) -> list[str]:
+        return [
+            chunk_summary.summary
+            async for chunk_summary in summarizer.summarize_stream_async(
+                mocked_youtube_video,
+            )
+        ]
+
+    with mock.patch(
+        "youtube_summarizer.clients.youtube_transcript_client.YouTubeTranscriptClient.get_transcript",
+    ) as mock_transcript, mock.patch(
+        "youtube_summarizer.youtube_video_summarizer.YouTubeVideoSummarizer._summarize_chunk_async",
+        side_effect=summarize_chunk,
+    ):
+        mock_transcript.return_value = mock.Mock(
+            get_chunks=mock.Mock(return_value=mock_chunks),
+        )
+        client = mock.Mock()
+        summarizer = YouTubeVideoSummarizer(openai_client=client)
+        summaries = asyncio.run(collect(summarizer))
+
+    assert summaries == mock_chunks
+
+
+def test_summarize_async_starts_requests_before_all_chunks_are_built(
+    mocked_youtube_video: YouTubeVideo,
+) -> None:
+    events: list[str] = []
+
+    def get_chunks(*_: object) -> Generator[str, None, None]:
+        for chunk in ("chunk1", "chunk2"):
+            events.append(f"built {chunk}")
+            yield chunk
+
+    async def summarize_chunk(chunk: str, **_: object) -> tuple[str, dict]:
+        events.append(f"summarizing {chunk}")
+        return chunk, mocked_usage
+
+    with mock.patch(
+        "youtube_summarizer.clients.youtube_transcript_client.YouTubeTranscriptClient.get_transcript",
+    ) as mock_transcript, mock.patch(
+        "youtube_summarizer.youtube_video_summarizer.YouTubeVideoSummarizer._summarize_chunk_async",
+        side_effect=summarize_chunk,
+    ):
+        mock_transcript.return_value = mock.Mock(get_chunks=get_chunks)
+        client = mock.Mock()
+        summarizer = YouTubeVideoSummarizer(openai_client=client)
+        asyncio.run(summarizer.summarize_async(mocked_youtube_video))
+
+    assert events.index("summarizing chunk1") < events.index("built chunk2")
+
+
+def test_summarize_bulk_submits_one_batch_for_all_videos() -> None:
+    transcripts: dict[str, list[str]] = {
+        "video1": ["video1 chunk1", "video1 chunk2"],
+        "video2": ["video2 chunk1"],
+    }
+
+    with mock.patch(
+        "youtube_summarizer.clients.youtube_transcript_client.YouTubeTranscriptClient.get_transcript",
+        side_effect=lambda video_id: mock.Mock(
+            get_chunks=mock.Mock(return_value=iter(transcripts[video_id])),
+        ),
+    ):
+        client = mock.Mock()
+        client.generate_chat_completions_batch.side_effect = lambda chunks, **_: [
+            ({"content": f"- {chunk}"}, mocked_usage) for chunk in chunks
+        ]
+        summarizer = YouTubeVideoSummarizer(openai_client=client)
+        summarizations = summarizer.summarize_bulk(
+            [YouTubeVideo(video_id) for video_id in transcripts],
+        )
+
+    client.generate_chat_completions_batch.assert_called_once()
+    assert [summarization.summary for summarization in summarizations] == list(
+        transcripts.values(),
+    )
+    assert summarizations[1].meta.prompt_tokens == mocked_usage["prompt_tokens"]
+
+
+def test_summarize_stream_async_unordered_yields_chunks_as_completed(
+    mocked_youtube_video: YouTubeVideo,
+) -> None:
+    mock_chunks: list[str] = ["chunk1", "chunk2", "chunk3"]
+
+    async def summarize_chunk(chunk: str, **_: object) -> tuple[str, dict]:
+        # Finish the chunks in reverse order.
+        await asyncio.sleep(0.01 * (len(mock_chunks) - mock_chunks.index(chunk)))
+        return chunk, mocked_usage
+
+    async def collect(summarizer: YouTubeVideoSummarizer) -> list[tuple[int, str]]:
+        return [
+            (chunk_summary.chunk_index, chunk_summary.summary)
+            async for chunk_summary in summarizer.summarize_stream_async(
+                mocked_youtube_video,
+                ordered=False,
+            )
+        ]
+
+    with mock.patch(
+        "youtube_summarizer.clients.youtube_transcript_client.YouTubeTranscriptClient.get_transcript",
+    ) as mock_transcript, mock.patch(
+        "youtube_summarizer.youtube_video_summarizer.YouTubeVideoSummarizer._summarize_chunk_async",
+        side_effect=summarize_chunk,
+    ):
+        mock_transcript.return_value = mock.Mock(
+            get_chunks=mock.Mock(return_value=mock_chunks),
+        )
+        client = mock.Mock()
+        summarizer = YouTubeVideoSummarizer(openai_client=client)
+        summaries = asyncio.run(collect(summarizer))
+
+    assert summaries == [(2, "chunk3"), (1, "chunk2"), (0, "chunk1")]
+
+
+def test_summarize_reserves_system_prompt_and_response_tokens(
+    mocked_youtube_video: YouTubeVideo,
+) -> None:
+    get_chunks = mock.Mock(return_value=["chunk1"])
+
+    with mock.patch(
+        "youtube_summarizer.clients.youtube_transcript_client.YouTubeTranscriptClient.get_transcript",
+    ) as mock_transcript, mock.patch(
+        "youtube_summarizer.youtube_video_summarizer.YouTubeVideoSummarizer._summarize_chunk",
+        return_value=(mock_summary, mocked_usage),
+    ):
+        mock_transcript.return_value = mock.Mock(get_chunks=get_chunks)
+        summarizer = YouTubeVideoSummarizer(
+            openai_client=mock.Mock(),
+            token_limit=1000,
+            min_new_tokens=100,
+        )
+        summarizer.summarize(mocked_youtube_video)
+
+    system_prompt_tokens: int = get_tokenizer(
+        "gpt-4o-mini-2024-07-18",
+    ).count_tokens(SUMMARIZATION_SYSTEM_PROMPT)
+
+    assert get_chunks.call_args.args[0] == 1000 - system_prompt_tokens - 100
+
+
+def test_init_with_token_limit_below_prompt_size_raises_value_error() -> None:
+    with pytest.raises(ValueError, match="token_limit"):
+        YouTubeVideoSummarizer(openai_client=mock.Mock(), token_limit=100)
+
+
+def test_summarize_async_cancels_pending_chunks_on_failure(
+    mocked_youtube_video: YouTubeVideo,
+) -> None:
+    cancelled_chunks: list[str] = []
+
+    async def summarize_chunk(chunk: str, **_: object) -> tuple[str, dict]:
+        if chunk == "chunk1":
+            raise RuntimeError("Failed to summarize chunk")
+
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled_chunks.append(chunk)
+            raise
+
+        return chunk, mocked_usage
+
+    with mock.patch(
+        "youtube_summarizer.clients.youtube_transcript_client.YouTubeTranscriptClient.get_transcript",
+    ) as mock_transcript, mock.patch(
+        "youtube_summarizer.youtube_video_summarizer.YouTubeVideoSummarizer._summarize_chunk_async",
+        side_effect=summarize_chunk,
+    ), pytest.raises(RuntimeError, match="Failed to summarize chunk"):
+        mock_transcript.return_value = mock.Mock(
+            get_chunks=mock.Mock(return_value=["chunk1", "chunk2"]),
+        )
+        summarizer = YouTubeVideoSummarizer(openai_client=mock.Mock())
+        asyncio.run(summarizer.summarize_async(mocked_youtube_video))
+
+    assert cancelled_chunks == ["chunk2"]
+
+
+def test_summarize_skips_pending_chunks_on_failure(
+    mocked_youtube_video: YouTubeVideo,
+) -> None:
+    summarized_chunks: list[str] = []
+
+    def summarize_chunk(chunk: str, **_: object) -> tuple[str, dict]:
+        summarized_chunks.append(chunk)
+        raise RuntimeError("Failed to summarize chunk")
+
+    with mock.patch(
+        "youtube_summarizer.clients.youtube_transcript_client.YouTubeTranscriptClient.get_transcript",
+    ) as mock_transcript, mock.patch(
+        "youtube_summarizer.youtube_video_summarizer.YouTubeVideoSummarizer._summarize_chunk",
+        side_effect=summarize_chunk,
+    ), pytest.raises(RuntimeError, match="Failed to summarize chunk"):
+        mock_transcript.return_value = mock.Mock(
+            get_chunks=mock.Mock(return_value=[f"chunk{i}" for i in range(100)]),
+        )
+        summarizer = YouTubeVideoSummarizer(
+            openai_client=mock.Mock(), max_concurrency=1
+        )
+        summarizer.summarize(mocked_youtube_video)
+
+    assert len(summarized_chunks) < 100  # noqa: PLR2004
+
+
+def test_summarize_with_cache_reuses_recent_summaries() -> None:
+    with mock.patch(
+        "youtube_summarizer.clients.youtube_transcript_client.YouTubeTranscriptClient.get_transcript",
+    ) as mock_transcript, mock.patch(
+        "youtube_summarizer.youtube_video_summarizer.YouTubeVideoSummarizer._summarize_chunk",
+        return_value=(mock_summary, mocked_usage),
+    ):
+        mock_transcript.return_value = mock.Mock(
+            get_chunks=mock.Mock(return_value=["chunk1"]),
+        )
+        summarizer = YouTubeVideoSummarizer(
+            openai_client=mock.Mock(),
+            max_cache_entries=1,
+        )
+        first_summarization = summarizer.summarize(YouTubeVideo("video1"))
+        cached_summarization = summarizer.summarize(YouTubeVideo("video1"))
+        summarizer.summarize(YouTubeVideo("video2"))
+        summarizer.summarize(YouTubeVideo("video1"))
+
+    assert cached_summarization is first_summarization
+    assert [call.kwargs["video_id"] for call in mock_transcript.call_args_list] == [
+        "video1",
+        "video2",
+        "video1",
+    ]
+
+
+def test_summarize_deltas_async_yields_deltas_in_chunk_order(
+    mocked_youtube_video: YouTubeVideo,
+) -> None:
+    mock_chunks: list[str] = ["chunk1", "chunk2"]
+
+    async def stream_chunk(
+        chunk: str,
+        **_: object,
+    ) -> AsyncGenerator[ChatCompletionDelta, None]:
+        # The second chunk finishes first but is yielded after the first one.
+        if chunk == "chunk1":
+            await asyncio.sleep(0.01)
+
+        yield ChatCompletionDelta(f"{chunk} ")
+        yield ChatCompletionDelta("done", mocked_usage)
+
+    async def collect(summarizer: YouTubeVideoSummarizer) -> list[SummaryDelta]:
+        return [
+            summary_delta
+            async for summary_delta in summarizer.summarize_deltas_async(
+                mocked_youtube_video,
+            )
+        ]
+
+    with mock.patch(
+        "youtube_summarizer.clients.youtube_transcript_client.YouTubeTranscriptClient.get_transcript",
+    ) as mock_transcript, mock.patch(
+        "youtube_summarizer.youtube_video_summarizer.YouTubeVideoSummarizer._stream_summarize_chunk_async",
+        side_effect=stream_chunk,
+    ):
+        mock_transcript.return_value = mock.Mock(
+            get_chunks=mock.Mock(return_value=mock_chunks),
+        )
+        summarizer = YouTubeVideoSummarizer(openai_client=mock.Mock())
+        summary_deltas = asyncio.run(collect(summarizer))
+
+    assert [summary_delta.chunk_index for summary_delta in summary_deltas] == [
+        0,
+        0,
+        1,
+        1,
+    ]
+    assert [summary_delta.content for summary_delta in summary_deltas] == [
+        "chunk1 ",
+        "done",
+        "chunk2 ",
+        "done",
+    ]
+    assert [summary_delta.usage for summary_delta in summary_deltas] == [
+        None,
+        mocked_usage,
+        None,
+        mocked_usage,
+    ]
+
+
+def test_summarize_async_with_allow_partial_skips_failed_chunks(
+    mocked_youtube_video: YouTubeVideo,
+) -> None:
+    async def summarize_chunk(chunk: str, **_: object) -> tuple[str, dict]:
+        if chunk == "chunk2":
+            raise RuntimeError("Failed to summarize chunk")
+
+        return f"- {chunk}", mocked_usage
+
+    with mock.patch(
+        "youtube_summarizer.clients.youtube_transcript_client.YouTubeTranscriptClient.get_transcript",
+    ) as mock_transcript, mock.patch(
+        "youtube_summarizer.youtube_video_summarizer.YouTubeVideoSummarizer._summarize_chunk_async",
+        side_effect=summarize_chunk,
+    ):
+        mock_transcript.return_value = mock.Mock(
+            get_chunks=mock.Mock(return_value=["chunk1", "chunk2", "chunk3"]),
+        )
+        summarizer = YouTubeVideoSummarizer(openai_client=mock.Mock())
+        summarization = asyncio.run(
+            summarizer.summarize_async(mocked_youtube_video, allow_partial=True),
+        )
+
+    assert summarization.summary == ["chunk1", "chunk3"]
+    assert summarization.meta.failed_chunks == 1
+    assert summarization.meta.prompt_tokens == 2 * mocked_usage["prompt_tokens"]
+
+
+def test_summarize_stream_async_cancels_started_chunks_when_chunking_fails(
+    mocked_youtube_video: YouTubeVideo,
+) -> None:
+    cancelled_chunks: list[str] = []
+
+    def get_chunks(*_: object) -> Generator[str, None, None]:
+        yield "chunk1"
+        raise RuntimeError("Failed to chunk transcript")
+
+    async def summarize_chunk(chunk: str, **_: object) -> tuple[str, dict]:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled_chunks.append(chunk)
+            raise
+
+        return chunk, mocked_usage
+
+    async def consume(summarizer: YouTubeVideoSummarizer) -> list[str]:
+        with pytest.raises(RuntimeError, match="Failed to chunk transcript"):
+            async for _ in summarizer.summarize_stream_async(mocked_youtube_video):
+                pass
+
+        # Let the started task handle its cancellation before the loop shuts down
+        # and cancels whatever is left.
+        await asyncio.sleep(0)
+        return list(cancelled_chunks)
+
+    with mock.patch(
+        "youtube_summarizer.clients.youtube_transcript_client.YouTubeTranscriptClient.get_transcript",
+    ) as mock_transcript, mock.patch(
+        "youtube_summarizer.youtube_video_summarizer.YouTubeVideoSummarizer._summarize_chunk_async",
+        side_effect=summarize_chunk,
+    ):
+        mock_transcript.return_value = mock.Mock(get_chunks=get_chunks)
+        summarizer = YouTubeVideoSummarizer(openai_client=mock.Mock())
+        cancelled_before_shutdown = asyncio.run(consume(summarizer))
+
+    assert cancelled_before_shutdown == ["chunk1"]
+
+
+def test_summarize_deltas_async_cancels_started_chunks_when_chunking_fails(
+    mocked_youtube_video: YouTubeVideo,
+) -> None:
+    cancelled_chunks: list[str] = []
+
+    def get_chunks(*_: object) -> Generator[str, None, None]:
+        yield "chunk1"
+        raise RuntimeError("Failed to chunk transcript")
+
+    async def stream_chunk(
+        chunk: str,
+        **_: object,
+    ) -> AsyncGenerator[ChatCompletionDelta, None]:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled_chunks.append(chunk)
+            raise
+
+        yield ChatCompletionDelta(chunk, mocked_usage)
+
+    async def consume(summarizer: YouTubeVideoSummarizer) -> list[str]:
+        with pytest.raises(RuntimeError, match="Failed to chunk transcript"):
+            async for _ in summarizer.summarize_deltas_async(mocked_youtube_video):
+                pass
+
+        await asyncio.sleep(0)
+        return list(cancelled_chunks)
+
+    with mock.patch(
+        "youtube_summarizer.clients.youtube_transcript_client.YouTubeTranscriptClient.get_transcript",
+    ) as mock_transcript, mock.patch(
+        "youtube_summarizer.youtube_video_summarizer.YouTubeVideoSummarizer._stream_summarize_chunk_async",
+        side_effect=stream_chunk,
+    ):
+        mock_transcript.return_value = mock.Mock(get_chunks=get_chunks)
+        summarizer = YouTubeVideoSummarizer(openai_client=mock.Mock())
+        cancelled_before_shutdown = asyncio.run(consume(summarizer))
+
+    assert cancelled_before_shutdown == ["chunk1"]
@@ -1,25 +1,205 @@
 import asyncio
 import os
 import sys
-from argparse import ArgumentParser, Namespace
-from typing import TYPE_CHECKING
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
+from collections.abc import Coroutine
+from typing import Any, TypeVar
 
 from loguru import logger
 
 from youtube_summarizer.clients.openai_client import OpenAIClient
+from youtube_summarizer.types.video_usage_meta import VideoUsageMeta
+from youtube_summarizer.utils.constants import DEFAULT_MAX_CONCURRENCY
+from youtube_summarizer.utils.model_limits import get_model_token_limit
+from youtube_summarizer.utils.response_cache import ResponseCache
 from youtube_summarizer.youtube_video import YouTubeVideo
 from youtube_summarizer.youtube_video_summarizer import (
     SummarizationOutputFormat,
     YouTubeVideoSummarizer,
 )
 
-if TYPE_CHECKING:  # pragma: no cover
-    from youtube_summarizer.types.video_usage_meta import VideoUsageMeta
-
 # Add a new logging handler.
 logger.remove()
 logger.add(sys.stdout, level=os.environ.get("LOG_LEVEL", "INFO").upper())
 
+T = TypeVar("T")
+
+# Smaller chunks give more detailed summaries than filling a large context.
+DEFAULT_CONTEXT_LENGTH = 20000
+
+
+def _positive_int(value: str) -> int:
+    """Parse a command line value that must be a whole number of at least 1.
+
+    Args:
+    ----
+        value: The raw command line value.
+
+    Returns:
+    -------
+        The parsed number.
+
+    Raises:
+    ------
+        ArgumentTypeError: If the value is not an integer of at least 1.
+
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise ArgumentTypeError(f"Expected an integer, got {value!r}.") from None
+
+    if number < 1:
+        raise ArgumentTypeError(f"Expected a value of at least 1, got {number}.")
+
+    return number
+
+
+def _validate_args(parser: ArgumentParser, args: Namespace) -> None:
+    """Exit with a usage error if the given flags cannot be used together.
+
+    Args:
+    ----
+        parser: The parser the arguments were parsed with.
+        args: The parsed arguments.
+
+    """
+    # Streamed summaries are logged chunk by chunk, so flags that choose how the
+    # whole summary is generated or formatted cannot apply to them.
+    if args.stream:
+        for flag, is_set in (
+            ("--batch", args.batch),
+            ("--run-async", args.run_async),
+            ("--output-format", args.output_format is not None),
+        ):
+            if is_set:
+                parser.error(f"{flag} cannot be used with --stream.")
+
+    if args.batch and args.run_async:
+        parser.error("--run-async cannot be used with --batch.")
+
+    # Only the async methods wait on the rate limiter.
+    if args.tokens_per_minute is not None and not (args.run_async or args.stream):
+        parser.error("--tokens-per-minute requires --run-async or --stream.")
+
+
+async def _run_and_close(
+    openai_client: OpenAIClient,
+    coroutine: Coroutine[Any, Any, T],
+) -> T:
+    """Run a coroutine and close the client's async session afterwards.
+
+    Args:
+    ----
+        openai_client: The client used by the coroutine.
+        coroutine: The coroutine to run.
+
+    Returns:
+    -------
+        The result of the coroutine.
+
+    """
+    async with openai_client:
+        return await coroutine
+
+
+async def _log_streamed_summary(
+    summarizer: YouTubeVideoSummarizer,
+    youtube_video: YouTubeVideo,
+    *,
+    detailed: bool,
+) -> VideoUsageMeta:
+    """Log each chunk summary of a video as soon as it is available.
+
+    Args:
+    ----
+        summarizer: The summarizer to use.
+        youtube_video: The video to summarize.
+        detailed: Whether to generate detailed summaries.
+
+    Returns:
+    -------
+        The total usage of the summarization.
+
+    """
+    prompt_tokens = 0
+    completion_tokens = 0
+
+    async for chunk_summary in summarizer.summarize_stream_async(
+        youtube_video,
+        detailed=detailed,
+    ):
+        logger.info(f"Summarized chunk: {chunk_summary.summary}")
+        prompt_tokens += chunk_summary.usage["prompt_tokens"]
+        completion_tokens += chunk_summary.usage["completion_tokens"]
+
+    return VideoUsageMeta(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+    )
+
+
+def _summarize_video(
+    args: Namespace,
+    openai_client: OpenAIClient,
+    summarizer: YouTubeVideoSummarizer,
+    youtube_video: YouTubeVideo,
+    output_format: str,
+) -> VideoUsageMeta:
+    """Summarize a video the way the command line flags ask for.
+
+    Args:
+    ----
+        args: The parsed command line arguments.
+        openai_client: The client used by the summarizer.
+        summarizer: The summarizer to use.
+        youtube_video: The video to summarize.
+        output_format: The output format of the summary.
+
+    Returns:
+    -------
+        The total usage of the summarization.
+
+    """
+    if args.stream:
+        return asyncio.run(
+            _run_and_close(
+                openai_client,
+                _log_streamed_summary(
+                    summarizer,
+                    youtube_video,
+                    detailed=args.detailed,
+                ),
+            ),
+        )
+
+    if args.batch:
+        summarization = summarizer.summarize_batch(
+            youtube_video,
+            output_format=output_format,
+            detailed=args.detailed,
+        )
+    elif args.run_async:
+        summarization = asyncio.run(
+            _run_and_close(
+                openai_client,
+                summarizer.summarize_async(
+                    youtube_video,
+                    output_format=output_format,
+                    detailed=args.detailed,
+                ),
+            ),
+        )
+    else:
+        summarization = summarizer.summarize(
+            youtube_video,
+            output_format=output_format,
+            detailed=args.detailed,
+        )
+
+    logger.info(f"Summarized video: {summarization.summary}")
+    return summarization.meta
+
 
 def main() -> None:
     """Run the CLI."""
@@ -44,6 +224,29 @@ def main() -> None:
         help="If should run asynchronously.",
         action="store_true",
     )
+    parser.add_argument(
+        "--stream",
+        "-s",
+        help="If each chunk summary should be printed as soon as it is available.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--batch",
+        "-b",
+        help=(
+            "If the OpenAI Batch API should be used. Costs less but can take up to "
+            "24 hours to complete."
+        ),
+        action="store_true",
+    )
+    parser.add_argument(
+        "--cache",
+        help=(
+            "If chunk responses should be cached on disk so re-running the same "
+            "video does not call the API again."
+        ),
+        action="store_true",
+    )
     parser.add_argument(
         "--detailed",
         "-d",
@@ -62,23 +265,48 @@ def main() -> None:
         "--model-context-length",
         "-c",
         help=(
-            "The OpenAI Chat Completion model context length. "
-            "Should correspond to the model name."
+            "The OpenAI Chat Completion model context length. Defaults to "
+            f"{DEFAULT_CONTEXT_LENGTH} tokens, or the model's known context length "
+            "if it is smaller."
         ),
-        default=20000,
+        default=None,
         type=int,
         required=False,
     )
+    parser.add_argument(
+        "--max-concurrency",
+        help="The maximum number of chunks to summarize at once.",
+        default=DEFAULT_MAX_CONCURRENCY,
+        type=_positive_int,
+        required=False,
+    )
+    parser.add_argument(
+        "--tokens-per-minute",
+        help=(
+            "The maximum number of prompt tokens to send per minute when running "
+            "asynchronously. Unlimited by default."
+        ),
+        default=None,
+        type=_positive_int,
+        required=False,
+    )
     parser.add_argument(
         "--output-format",
         "-o",
-        help="The output format of the summary.",
-        default=SummarizationOutputFormat.LIST.value,
+        help=(
+            "The output format of the summary. Defaults to "
+            f"{SummarizationOutputFormat.LIST.value}."
+        ),
+        default=None,
         type=str,
         required=False,
     )
 
     args: Namespace = parser.parse_args()
+
+    _validate_args(parser, args)
+
+    output_format: str = args.output_format or SummarizationOutputFormat.LIST.value
     openai_api_key: str | None = args.openai_api_key
 
     if openai_api_key is None:
@@ -89,35 +317,41 @@ def main() -> None:
             "Expected api_key parameter or OPENAI_API_KEY env var to be set.",
         )
 
-    openai_client = OpenAIClient(openai_api_key)
+    token_limit: int = (
+        min(DEFAULT_CONTEXT_LENGTH, get_model_token_limit(args.model_name))
+        if args.model_context_length is None
+        else args.model_context_length
+    )
+    response_cache: ResponseCache | None = ResponseCache() if args.cache else None
+    openai_client = OpenAIClient(openai_api_key, response_cache=response_cache)
     summarizer = YouTubeVideoSummarizer(
         openai_client=openai_client,
         model_name=args.model_name,
-        token_limit=args.model_context_length,
+        token_limit=token_limit,
+        max_concurrency=args.max_concurrency,
+        tokens_per_minute=args.tokens_per_minute,
     )
     youtube_video = YouTubeVideo(args.video_url_or_id)
 
     logger.info(f"Summarizing video {args.video_url_or_id}...")
 
-    if args.run_async:
-        summarization = asyncio.run(
-            summarizer.summarize_async(
-                youtube_video, output_format=args.output_format, detailed=args.detailed
-            ),
-        )
-    else:
-        summarization = summarizer.summarize(
+    try:
+        meta: VideoUsageMeta = _summarize_video(
+            args,
+            openai_client,
+            summarizer,
             youtube_video,
-            output_format=args.output_format,
-            detailed=args.detailed,
+            output_format,
         )
+    finally:
+        # The client does not own the cache, so close it once the run is over.
+        if response_cache is not None:
+            response_cache.close()
 
-    meta: VideoUsageMeta = summarization.meta
     prompt_tokens: int = meta.prompt_tokens
     completion_tokens: int = meta.completion_tokens
     total_tokens: int = prompt_tokens + completion_tokens
 
-    logger.info(f"Summarized video: {summarization.summary}")
     logger.info(f"Prompt tokens: {prompt_tokens}")
     logger.info(f"Completion tokens: {completion_tokens}")
     logger.info(f"Total tokens: {total_tokens}")
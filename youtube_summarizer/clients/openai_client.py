@@ -1,18 +1,56 @@
 """Module for interacting with the OpenAI API."""
 
+import asyncio
+import io
+import json
 import os
+import random
+import time
+from collections.abc import AsyncGenerator
 from enum import Enum
-from typing import Any, TypedDict
+from http import HTTPStatus
+from typing import Any, NamedTuple, TypedDict
 
+import aiohttp
 import openai
+import requests
 from loguru import logger
+from openai.api_resources.abstract import CreateableAPIResource
 
+from youtube_summarizer.utils.response_cache import ResponseCache
 
-class TextGenerationError(BaseException):
+DEFAULT_MAX_CONNECTIONS = 32
+DEFAULT_MAX_RETRIES = 3
+RETRY_BASE_DELAY_SECONDS = 1.0
+RETRY_MAX_DELAY_SECONDS = 20.0
+BATCH_POLL_INTERVAL_SECONDS = 30.0
+
+CHAT_COMPLETIONS_ENDPOINT = "/v1/chat/completions"
+_BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+# Errors that are worth retrying because a later attempt may succeed. APIError
+# covers 5xx responses but is only retried for those, see _is_retryable.
+_RETRYABLE_ERRORS: tuple[type[openai.error.OpenAIError], ...] = (
+    openai.error.RateLimitError,
+    openai.error.ServiceUnavailableError,
+    openai.error.TryAgain,
+    openai.error.Timeout,
+    openai.error.APIConnectionError,
+    openai.error.APIError,
+)
+
+
+class TextGenerationError(Exception):
 
     """Exception raised for text generation errors."""
 
 
+class Batch(CreateableAPIResource):
+
+    """The Batch API resource, which the pinned openai SDK does not provide."""
+
+    OBJECT_NAME = "batches"
+
+
 class ChatRole(str, Enum):
 
     """Enum representing the role options for a ChatCompletion input message."""
@@ -37,22 +75,137 @@ class ChatCompletionMessage(TypedDict):
     content: str
 
 
-class MessageRole(str, Enum):
+class ChatCompletionDelta(NamedTuple):
 
-    """Enum representing the role options for a ChatCompletion input message.
+    """A piece of a streamed chat completion.
 
     Args:
     ----
-        USER: The user role.
-        ASSISTANT: The assistant role.
-        SYSTEM: The system role.
+        content: The text generated since the previous delta.
+        usage: The usage of the whole completion, only set on the last delta.
 
     """
 
-    __slots__ = ()
-    USER = "user"
-    ASSISTANT = "assistant"
-    SYSTEM = "system"
+    content: str
+    usage: dict | None = None
+
+
+def _build_messages(
+    user_prompt: str,
+    system_prompt: str | None,
+) -> list[ChatCompletionMessage]:
+    """Build the input messages for a chat completion.
+
+    Args:
+    ----
+        user_prompt: The user prompt.
+        system_prompt: The optional system prompt to send before the user prompt.
+
+    Returns:
+    -------
+        The list of messages in the order they should be sent.
+
+    """
+    user_message: ChatCompletionMessage = {
+        "role": ChatRole.USER,
+        "content": user_prompt,
+    }
+
+    if not system_prompt:
+        return [user_message]
+
+    return [{"role": ChatRole.SYSTEM, "content": system_prompt}, user_message]
+
+
+def _cached_response(content: str) -> tuple[dict, dict]:
+    """Build a chat completion response from cached content.
+
+    Args:
+    ----
+        content: The cached response content.
+
+    Returns:
+    -------
+        The response message and a usage dict reporting no tokens.
+
+    """
+    return (
+        {"role": ChatRole.ASSISTANT.value, "content": content},
+        {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    )
+
+
+def _make_requests_session(max_connections: int) -> requests.Session:
+    """Create a requests session with a shared keep-alive connection pool.
+
+    Args:
+    ----
+        max_connections: The maximum number of connections to keep in the pool.
+
+    Returns:
+    -------
+        The session to send synchronous API requests with.
+
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        requests.adapters.HTTPAdapter(
+            pool_maxsize=max_connections,
+            max_retries=openai.api_requestor.MAX_CONNECTION_RETRIES,
+        ),
+    )
+    return session
+
+
+def _is_retryable(error: openai.error.OpenAIError) -> bool:
+    """Return whether a failed request should be retried.
+
+    Args:
+    ----
+        error: The error the request failed with.
+
+    Returns:
+    -------
+        True for rate limits, timeouts, connection errors and server errors.
+
+    """
+    if isinstance(error, openai.error.APIError):
+        return error.http_status is None or error.http_status >= 500  # noqa: PLR2004
+
+    return isinstance(error, _RETRYABLE_ERRORS)
+
+
+def _get_retry_delay(attempt: int, error: openai.error.OpenAIError) -> float:
+    """Return the delay before retrying a request.
+
+    The Retry-After header is honored when the API sends one. Otherwise the delay
+    is drawn uniformly up to a capped exponential backoff ("full jitter"), so
+    concurrent requests that failed together do not all retry together.
+
+    Args:
+    ----
+        attempt: The zero based number of the attempt that failed.
+        error: The error the attempt failed with.
+
+    Returns:
+    -------
+        The number of seconds to wait.
+
+    """
+    headers: Any = error.headers or {}
+    retry_after: str | None = headers.get("Retry-After") or headers.get("retry-after")
+
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), RETRY_MAX_DELAY_SECONDS)
+        except ValueError:
+            pass
+
+    return random.uniform(  # noqa: S311
+        0.0,
+        min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * 2**attempt),
+    )
 
 
 class OpenAIClient:
@@ -65,12 +218,27 @@ class OpenAIClient:
 
     """
 
-    def __init__(self, api_key: str | None = None) -> None:
+    def __init__(
+        self,
+        api_key: str | None = None,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        response_cache: ResponseCache | None = None,
+    ) -> None:
         """Initialize the OpenAIClient instance.
 
         Args:
         ----
             api_key: The OpenAI API key.
+            max_connections: The maximum number of keep-alive connections to pool.
+              The synchronous pool is installed as the process-wide
+              openai.requestssession, like the API key, so when several clients
+              are created the last one's pool is used by all of them.
+            max_retries: The number of times to retry a rate limited or failed request.
+            response_cache: An optional cache of chat completion responses, used by
+              both the sync and async methods. Cached responses are returned
+              without calling the API and report no usage.
 
         """
         if not api_key and "OPENAI_API_KEY" not in os.environ:
@@ -79,6 +247,16 @@ class OpenAIClient:
             )
 
         openai.api_key = api_key or os.environ.get("OPENAI_API_KEY")
+        # The SDK otherwise creates a session per thread, so concurrent chunk calls
+        # made from worker threads would each pay for a new TLS connection.
+        openai.requestssession = _make_requests_session(max_connections)
+        self._max_connections: int = max_connections
+        self._max_retries: int = max_retries
+        # Async calls share one aiohttp session per event loop. Without it the SDK
+        # opens (and closes) a new session, and TLS connection, for every request.
+        self._aiohttp_session: aiohttp.ClientSession | None = None
+        self._aiohttp_session_loop: asyncio.AbstractEventLoop | None = None
+        self._response_cache: ResponseCache | None = response_cache
 
     def generate_chat_completion(
         self,
@@ -104,17 +282,24 @@ class OpenAIClient:
         """
         logger.debug("Generating chat completion...")
 
-        messages: list[ChatCompletionMessage] = [
-            ChatCompletionMessage(role=ChatRole.USER, content=user_prompt),
-        ]
+        cache_key: str | None = self._get_cache_key(
+            model=model,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            user_prompt=user_prompt,
+        )
+        cached_response: tuple[dict, dict] | None = self._get_cached_response(
+            cache_key,
+        )
 
-        if system_prompt:
-            messages.insert(
-                0,
-                ChatCompletionMessage(role=ChatRole.SYSTEM, content=system_prompt),
-            )
+        if cached_response is not None:
+            return cached_response
 
-        response: Any = openai.ChatCompletion.create(
+        messages: list[ChatCompletionMessage] = _build_messages(
+            user_prompt,
+            system_prompt,
+        )
+        response: Any = self._create_chat_completion(
             model=model,
             messages=messages,
             temperature=temperature,
@@ -122,6 +307,8 @@ class OpenAIClient:
 
         message_dict: dict = response["choices"][0]["message"]
         usage_dict: dict = response["usage"]
+
+        self._cache_response(cache_key, message_dict)
         return message_dict, usage_dict
 
     async def generate_chat_completion_async(
@@ -148,17 +335,24 @@ class OpenAIClient:
         """
         logger.debug("Generating async chat completion...")
 
-        messages: list[ChatCompletionMessage] = [
-            ChatCompletionMessage(role=ChatRole.USER, content=user_prompt),
-        ]
+        cache_key: str | None = self._get_cache_key(
+            model=model,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            user_prompt=user_prompt,
+        )
+        cached_response: tuple[dict, dict] | None = self._get_cached_response(
+            cache_key,
+        )
 
-        if system_prompt:
-            messages.insert(
-                0,
-                ChatCompletionMessage(role=ChatRole.SYSTEM, content=system_prompt),
-            )
+        if cached_response is not None:
+            return cached_response
 
-        response: Any = await openai.ChatCompletion.acreate(
+        messages: list[ChatCompletionMessage] = _build_messages(
+            user_prompt,
+            system_prompt,
+        )
+        response: Any = await self._create_chat_completion_async(
             model=model,
             messages=messages,
             temperature=temperature,
@@ -166,4 +360,354 @@ class OpenAIClient:
 
         message_dict: dict = response["choices"][0]["message"]
         usage_dict: dict = response["usage"]
+        self._cache_response(cache_key, message_dict)
         return message_dict, usage_dict
+
+    async def stream_chat_completion_async(
+        self,
+        user_prompt: str,
+        *,
+        model: str = "gpt-4o-mini-2024-07-18",
+        system_prompt: str | None = None,
+        temperature: float = 0.5,
+    ) -> AsyncGenerator[ChatCompletionDelta, None]:
+        """Generate a chat completion, yielding its text as it is generated.
+
+        Args:
+        ----
+            user_prompt: The user prompt to generate the chat completion from.
+            model: The model to use for the API.
+            system_prompt: The system prompt to use for the model.
+            temperature: The temperature to use for the model.
+
+        Returns:
+        -------
+            An async generator of the completion text. The last delta carries the
+            usage dict of the whole completion.
+
+        """
+        logger.debug("Streaming async chat completion...")
+
+        cache_key: str | None = self._get_cache_key(
+            model=model,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            user_prompt=user_prompt,
+        )
+        cached_response: tuple[dict, dict] | None = self._get_cached_response(
+            cache_key,
+        )
+
+        if cached_response is not None:
+            yield ChatCompletionDelta(cached_response[0]["content"], cached_response[1])
+            return
+
+        messages: list[ChatCompletionMessage] = _build_messages(
+            user_prompt,
+            system_prompt,
+        )
+        # Rate limits are reported before the first chunk, so only opening the
+        # stream is retried.
+        response_stream: Any = await self._create_chat_completion_async(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        content_parts: list[str] = []
+        usage_dict: dict | None = None
+
+        async for response_chunk in response_stream:
+            # The usage is sent in a final chunk without choices.
+            if response_chunk.get("usage"):
+                usage_dict = response_chunk["usage"]
+
+            if not response_chunk["choices"]:
+                continue
+
+            content: str | None = response_chunk["choices"][0]["delta"].get("content")
+
+            if content:
+                content_parts.append(content)
+                yield ChatCompletionDelta(content)
+
+        self._cache_response(cache_key, {"content": "".join(content_parts)})
+        yield ChatCompletionDelta(
+            "",
+            usage_dict or {"prompt_tokens": 0, "completion_tokens": 0},
+        )
+
+    def generate_chat_completions_batch(
+        self,
+        user_prompts: list[str],
+        *,
+        model: str = "gpt-4o-mini-2024-07-18",
+        system_prompt: str | None = None,
+        temperature: float = 0.5,
+    ) -> list[tuple[dict, dict]]:
+        """Generate chat completions for many prompts with the Batch API.
+
+        Batches are billed at a discount but can take up to 24 hours to complete,
+        so this blocks while polling until the batch finishes.
+
+        Args:
+        ----
+            user_prompts: The user prompts to generate chat completions from.
+            model: The model to use for the API.
+            system_prompt: The system prompt to use for every request.
+            temperature: The temperature to use for the model.
+
+        Returns:
+        -------
+            The response and usage information for each prompt, in prompt order.
+
+        Raises:
+        ------
+            TextGenerationError: If the batch or any of its requests failed.
+
+        """
+        if not user_prompts:
+            return []
+
+        logger.debug("Generating {} chat completions in a batch...", len(user_prompts))
+
+        batch_lines: list[str] = [
+            json.dumps(
+                {
+                    "custom_id": str(index),
+                    "method": "POST",
+                    "url": CHAT_COMPLETIONS_ENDPOINT,
+                    "body": {
+                        "model": model,
+                        "messages": _build_messages(user_prompt, system_prompt),
+                        "temperature": temperature,
+                    },
+                },
+            )
+            for index, user_prompt in enumerate(user_prompts)
+        ]
+        input_file: Any = openai.File.create(
+            file=io.BytesIO("\n".join(batch_lines).encode()),
+            purpose="batch",
+            user_provided_filename="batch.jsonl",
+        )
+        batch: Any = Batch.create(
+            input_file_id=input_file["id"],
+            endpoint=CHAT_COMPLETIONS_ENDPOINT,
+            completion_window="24h",
+        )
+
+        while batch["status"] not in _BATCH_TERMINAL_STATUSES:
+            logger.debug("Batch {} is {}...", batch["id"], batch["status"])
+            time.sleep(BATCH_POLL_INTERVAL_SECONDS)
+            batch = Batch.retrieve(batch["id"])
+
+        if batch["status"] != "completed":
+            raise TextGenerationError(
+                f"Batch {batch['id']} finished with status {batch['status']}.",
+            )
+
+        output: bytes = (
+            openai.File.download(batch["output_file_id"])
+            if batch.get("output_file_id")
+            else b""
+        )
+        results: dict[int, tuple[dict, dict]] = {}
+
+        for line in output.decode().splitlines():
+            record: dict = json.loads(line)
+            response: dict | None = record.get("response")
+
+            # Failed requests are left out and reported together below.
+            if not response or response["status_code"] != HTTPStatus.OK:
+                continue
+
+            body: dict = response["body"]
+            results[int(record["custom_id"])] = (
+                body["choices"][0]["message"],
+                body["usage"],
+            )
+
+        if len(results) != len(user_prompts):
+            raise TextGenerationError(
+                f"{len(user_prompts) - len(results)} of {len(user_prompts)} "
+                f"requests failed in batch {batch['id']}.",
+            )
+
+        return [results[index] for index in range(len(user_prompts))]
+
+    async def __aenter__(self) -> "OpenAIClient":
+        """Use the client as an async context manager that closes its session."""
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        """Close the aiohttp session used by the async methods."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the aiohttp session used by the async methods."""
+        if self._aiohttp_session is not None:
+            await self._aiohttp_session.close()
+
+        self._aiohttp_session = None
+        self._aiohttp_session_loop = None
+
+    def _get_cache_key(
+        self,
+        *,
+        model: str,
+        system_prompt: str | None,
+        temperature: float,
+        user_prompt: str,
+    ) -> str | None:
+        """Build the response cache key of a chat completion request.
+
+        Args:
+        ----
+            model: The model of the request.
+            system_prompt: The system prompt of the request.
+            temperature: The temperature of the request.
+            user_prompt: The user prompt of the request.
+
+        Returns:
+        -------
+            The cache key or None if no response cache is configured.
+
+        """
+        if self._response_cache is None:
+            return None
+
+        return self._response_cache.make_key(
+            model=model,
+            system_prompt=system_prompt or "",
+            temperature=temperature,
+            user_prompt=user_prompt,
+        )
+
+    def _get_cached_response(self, cache_key: str | None) -> tuple[dict, dict] | None:
+        """Get a cached chat completion response.
+
+        Args:
+        ----
+            cache_key: The cache key of the request.
+
+        Returns:
+        -------
+            The cached response and usage or None if the request is not cached.
+
+        """
+        if self._response_cache is None or cache_key is None:
+            return None
+
+        cached_content: str | None = self._response_cache.get(cache_key)
+
+        if cached_content is None:
+            return None
+
+        logger.debug("Using cached chat completion.")
+        return _cached_response(cached_content)
+
+    def _cache_response(self, cache_key: str | None, message: dict) -> None:
+        """Cache a chat completion response if a response cache is configured.
+
+        Args:
+        ----
+            cache_key: The cache key of the request.
+            message: The response message to cache.
+
+        """
+        if self._response_cache is not None and cache_key is not None:
+            self._response_cache.set(cache_key, message["content"])
+
+    def _create_chat_completion(self, **params: Any) -> Any:
+        """Create a chat completion, retrying transient errors with backoff.
+
+        Args:
+        ----
+            params: The parameters to create the chat completion with.
+
+        Returns:
+        -------
+            The chat completion response.
+
+        """
+        attempt = 0
+
+        while True:
+            try:
+                return openai.ChatCompletion.create(**params)
+            except _RETRYABLE_ERRORS as error:
+                if attempt >= self._max_retries or not _is_retryable(error):
+                    raise
+
+                delay: float = _get_retry_delay(attempt, error)
+                logger.warning(
+                    "OpenAI request failed ({}), retrying in {:.1f}s...",
+                    type(error).__name__,
+                    delay,
+                )
+                time.sleep(delay)
+                attempt += 1
+
+    async def _create_chat_completion_async(self, **params: Any) -> Any:
+        """Create a chat completion, retrying transient errors with backoff.
+
+        Args:
+        ----
+            params: The parameters to create the chat completion with.
+
+        Returns:
+        -------
+            The chat completion response.
+
+        """
+        openai.aiosession.set(await self._get_aiohttp_session())
+        attempt = 0
+
+        while True:
+            try:
+                return await openai.ChatCompletion.acreate(**params)
+            except _RETRYABLE_ERRORS as error:
+                if attempt >= self._max_retries or not _is_retryable(error):
+                    raise
+
+                delay: float = _get_retry_delay(attempt, error)
+                logger.warning(
+                    "OpenAI request failed ({}), retrying in {:.1f}s...",
+                    type(error).__name__,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _get_aiohttp_session(self) -> aiohttp.ClientSession:
+        """Get the aiohttp session for the running event loop.
+
+        Returns
+        -------
+            A pooled aiohttp session, created on first use in each event loop.
+
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        if (
+            self._aiohttp_session is not None
+            and not self._aiohttp_session.closed
+            and self._aiohttp_session_loop is not loop
+        ):
+            # A session is bound to the loop it was created in, so close the one
+            # left over from a previous loop instead of leaking its connector.
+            await self._aiohttp_session.close()
+
+        if (
+            self._aiohttp_session is None
+            or self._aiohttp_session.closed
+            or self._aiohttp_session_loop is not loop
+        ):
+            self._aiohttp_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._max_connections),
+            )
+            self._aiohttp_session_loop = loop
+
+        return self._aiohttp_session
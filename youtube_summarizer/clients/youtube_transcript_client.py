@@ -1,8 +1,40 @@
+from functools import lru_cache
+from operator import itemgetter
+
 from loguru import logger
 from youtube_transcript_api import YouTubeTranscriptApi  # type: ignore[import]
 
 from youtube_summarizer.video_transcript import VideoTranscript
 
+_get_text = itemgetter("text")
+
+
+@lru_cache(maxsize=128)
+def _fetch_transcript_lines(video_id: str) -> tuple[str, ...]:
+    """Fetch the text lines of a video transcript.
+
+    Results are cached per video ID so repeated requests for the same video do not
+    refetch the transcript.
+
+    Args:
+    ----
+        video_id: The ID of the video.
+
+    Returns:
+    -------
+        The text of each transcript line.
+
+    """
+    transcript: list[dict] = YouTubeTranscriptApi.get_transcript(video_id)
+
+    logger.debug(
+        "Received YouTube transcript for video {} with {} lines.",
+        video_id,
+        len(transcript),
+    )
+
+    return tuple(map(_get_text, transcript))
+
 
 class YouTubeTranscriptClient:
 
@@ -21,15 +53,4 @@ class YouTubeTranscriptClient:
             The transcript of the video.
 
         """
-        transcript: dict = YouTubeTranscriptApi.get_transcript(video_id)
-        transcript_chunks: list[str] = []
-
-        logger.debug(
-            f"Received YouTube transcript for video {video_id} "
-            "with {len(transcript)} lines.",
-        )
-
-        for line in transcript:
-            transcript_chunks.append(line["text"])
-
-        return VideoTranscript(transcript_chunks)
+        return VideoTranscript(_fetch_transcript_lines(video_id))
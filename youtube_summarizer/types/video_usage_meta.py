@@ -7,3 +7,5 @@ class VideoUsageMeta(NamedTuple):
 
     prompt_tokens: int
     completion_tokens: int
+    # The number of chunks left out of a partial summary.
+    failed_chunks: int = 0
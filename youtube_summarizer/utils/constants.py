@@ -0,0 +1,3 @@
+# The number of chunks sent to the API at once, shared by the summarizer and the
+# QA class so their defaults cannot diverge.
+DEFAULT_MAX_CONCURRENCY = 8
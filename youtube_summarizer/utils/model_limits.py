@@ -0,0 +1,36 @@
+GPT_35_TURBO_TOKEN_LIMIT = 4096
+GPT_4O_MINI_TOKEN_LIMIT = 128000
+
+# The context length of each model family. Dated model names such as
+# "gpt-4o-mini-2024-07-18" are matched by their longest known prefix.
+MODEL_TOKEN_LIMITS: dict[str, int] = {
+    "gpt-3.5-turbo": GPT_35_TURBO_TOKEN_LIMIT,
+    "gpt-4": 8192,
+    "gpt-4-32k": 32768,
+    "gpt-4-turbo": 128000,
+    "gpt-4o": 128000,
+    "gpt-4o-mini": GPT_4O_MINI_TOKEN_LIMIT,
+}
+
+_MODEL_PREFIXES: tuple[str, ...] = tuple(
+    sorted(MODEL_TOKEN_LIMITS, key=len, reverse=True),
+)
+
+
+def get_model_token_limit(model_name: str) -> int:
+    """Return the context length of a chat completion model.
+
+    Args:
+    ----
+        model_name: The name of the model.
+
+    Returns:
+    -------
+        The token limit of the model, or the gpt-4o-mini limit for unknown models.
+
+    """
+    for prefix in _MODEL_PREFIXES:
+        if model_name.startswith(prefix):
+            return MODEL_TOKEN_LIMITS[prefix]
+
+    return GPT_4O_MINI_TOKEN_LIMIT
@@ -0,0 +1,57 @@
+import asyncio
+import time
+
+SECONDS_PER_MINUTE = 60.0
+
+
+class TokenRateLimiter:
+
+    """An async token bucket limiting how many tokens are sent per minute."""
+
+    def __init__(self, tokens_per_minute: int) -> None:
+        """Initialize the TokenRateLimiter instance.
+
+        Args:
+        ----
+            tokens_per_minute: The maximum number of tokens to send per minute.
+
+        """
+        if tokens_per_minute < 1:
+            raise ValueError("Expected tokens_per_minute to be at least 1.")
+
+        self._capacity: float = float(tokens_per_minute)
+        self._tokens_per_second: float = tokens_per_minute / SECONDS_PER_MINUTE
+        self._available_tokens: float = self._capacity
+        self._updated_at: float = time.monotonic()
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until the given number of tokens can be sent.
+
+        Requests larger than the whole bucket wait for a full bucket instead of
+        waiting forever.
+
+        Args:
+        ----
+            tokens: The number of tokens the request will use.
+
+        """
+        tokens_needed: float = min(float(tokens), self._capacity)
+
+        while True:
+            now: float = time.monotonic()
+            self._available_tokens = min(
+                self._capacity,
+                self._available_tokens
+                + (now - self._updated_at) * self._tokens_per_second,
+            )
+            self._updated_at = now
+
+            # There is no await between the check and the update, so concurrent
+            # tasks on the event loop cannot both take the same tokens.
+            if self._available_tokens >= tokens_needed:
+                self._available_tokens -= tokens_needed
+                return
+
+            await asyncio.sleep(
+                (tokens_needed - self._available_tokens) / self._tokens_per_second,
+            )
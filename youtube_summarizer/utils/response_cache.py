@@ -0,0 +1,101 @@
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+
+DEFAULT_CACHE_PATH: Path = (
+    Path.home() / ".cache" / "youtube-summarizer" / "responses.sqlite3"
+)
+
+
+class ResponseCache:
+
+    """An on-disk cache of chat completion responses keyed by their prompts."""
+
+    def __init__(self, path: str | Path = DEFAULT_CACHE_PATH) -> None:
+        """Initialize the ResponseCache instance.
+
+        Args:
+        ----
+            path: The path of the SQLite database to store the responses in.
+
+        """
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # The connection is shared by the summarizer's worker threads, so access to
+        # it is serialized with a lock.
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, content TEXT NOT NULL)",
+            )
+
+    @staticmethod
+    def make_key(
+        *,
+        model: str,
+        system_prompt: str,
+        temperature: float,
+        user_prompt: str,
+    ) -> str:
+        """Build the cache key of a chat completion request.
+
+        Args:
+        ----
+            model: The model of the request.
+            system_prompt: The system prompt of the request.
+            temperature: The temperature of the request.
+            user_prompt: The user prompt of the request.
+
+        Returns:
+        -------
+            A hex digest identifying the request.
+
+        """
+        return hashlib.sha256(
+            f"{model}|{temperature}|{system_prompt}|{user_prompt}".encode(),
+        ).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Get a cached response.
+
+        Args:
+        ----
+            key: The cache key of the request.
+
+        Returns:
+        -------
+            The cached response content or None if the request is not cached.
+
+        """
+        with self._lock:
+            row: tuple[str] | None = self._connection.execute(
+                "SELECT content FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+        return row[0] if row else None
+
+    def set(self, key: str, content: str) -> None:
+        """Cache a response.
+
+        Args:
+        ----
+            key: The cache key of the request.
+            content: The response content to cache.
+
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, content) VALUES (?, ?)",
+                (key, content),
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
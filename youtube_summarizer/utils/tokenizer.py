@@ -1,5 +1,34 @@
+import os
+from functools import lru_cache
+
 import tiktoken
 
+# Token counts are memoized for short strings such as prompts, which are counted
+# over and over. Longer strings are counted directly so the cache stays small.
+_COUNT_TOKENS_CACHE_SIZE = 1024
+_MAX_CACHED_TEXT_LENGTH = 4096
+
+
+@lru_cache(maxsize=8)
+def get_encoding(model_name: str) -> tiktoken.Encoding:
+    """Return the cached tiktoken encoding for a model.
+
+    Args:
+    ----
+        model_name: The name of the model to get the encoding for.
+
+    Returns:
+    -------
+        The encoding used by the model.
+
+    """
+    return tiktoken.encoding_for_model(model_name)
+
+
+@lru_cache(maxsize=_COUNT_TOKENS_CACHE_SIZE)
+def _count_tokens(encoding: tiktoken.Encoding, text: str) -> int:
+    return len(encoding.encode_ordinary(text))
+
 
 class Tokenizer:
 
@@ -29,6 +58,23 @@ class Tokenizer:
         """
         return self._encoding.encode(text)
 
+    def encode_batch(self, texts: list[str]) -> list[list[int]]:
+        """Encode a list of strings into lists of tokens in parallel.
+
+        Args:
+        ----
+            texts: The strings to encode.
+
+        Returns:
+        -------
+            A list of tokens for each string.
+
+        """
+        return self._encoding.encode_ordinary_batch(
+            texts,
+            num_threads=os.cpu_count() or 1,
+        )
+
     def decode(self, encodings: list[int]) -> str:
         """Decode a list of tokens into a string.
 
@@ -46,6 +92,9 @@ class Tokenizer:
     def count_tokens(self, text: str) -> int:
         """Return the number of tokens in a string.
 
+        Special tokens such as "<|endoftext|>" are counted as ordinary text, so
+        counting never fails on user provided text.
+
         Args:
         ----
             text: The string to count tokens in.
@@ -55,4 +104,37 @@ class Tokenizer:
             The number of tokens.
 
         """
-        return len(self.encode(text))
+        if len(text) > _MAX_CACHED_TEXT_LENGTH:
+            return len(self._encoding.encode_ordinary(text))
+
+        return _count_tokens(self._encoding, text)
+
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Return the number of tokens in each of a list of strings.
+
+        Args:
+        ----
+            texts: The strings to count tokens in.
+
+        Returns:
+        -------
+            The number of tokens in each string.
+
+        """
+        return [len(tokens) for tokens in self.encode_batch(texts)]
+
+
+@lru_cache(maxsize=8)
+def get_tokenizer(model_name: str) -> Tokenizer:
+    """Return the cached tokenizer for a model.
+
+    Args:
+    ----
+        model_name: The name of the model to get the tokenizer for.
+
+    Returns:
+    -------
+        A tokenizer using the model's encoding.
+
+    """
+    return Tokenizer(get_encoding(model_name))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from urllib.parse import ParseResult, parse_qsl, urlparse
 
 
@@ -13,7 +14,11 @@ class URLParser:
             url: The URL to parse.
 
         """
-        self._result: ParseResult = urlparse(url)
+        self._url: str = url
+
+    @cached_property
+    def _result(self) -> ParseResult:
+        return urlparse(self._url)
 
     @property
     def scheme(self) -> str:
@@ -79,3 +84,22 @@ class URLParser:
 
         """
         return dict(parse_qsl(self.query_string))
+
+    def video_id(self) -> str | None:
+        """Return the value of the "v" query string parameter of the URL.
+
+        Scans the raw query string for the parameter instead of parsing the
+        full URL into a dictionary.
+
+        Returns
+        -------
+            The video ID or None if the URL has no "v" parameter.
+
+        """
+        query_string: str = self._url.partition("?")[2].partition("#")[0]
+
+        for parameter in query_string.split("&"):
+            if parameter.startswith("v="):
+                return parameter[2:] or None
+
+        return None
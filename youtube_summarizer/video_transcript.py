@@ -1,26 +1,33 @@
-from collections.abc import Generator
+import re
+from collections.abc import Generator, Sequence
 
 from loguru import logger
 
 from youtube_summarizer.utils.tokenizer import Tokenizer
 
+# Matches the whitespace after the end of a sentence.
+_SENTENCE_BREAK_RE: re.Pattern[str] = re.compile(r"(?<=[.!?])\s+")
+# Matches the whitespace between words.
+_WORD_BREAK_RE: re.Pattern[str] = re.compile(r"\s+")
+
 
 class VideoTranscript:
 
     """Represents a video transcript."""
 
-    def __init__(self, transcript_chunks: list[str]) -> None:
+    def __init__(self, transcript_chunks: Sequence[str]) -> None:
         """Initialize the Transcript instance.
 
         Args:
         ----
-            transcript_chunks: The list of transcript chunks.
+            transcript_chunks: The sequence of transcript chunks.
 
         """
         logger.debug(
-            f"Initialized transcript instance with {len(transcript_chunks)} lines.",
+            "Initialized transcript instance with {} lines.",
+            len(transcript_chunks),
         )
-        self._transcript_chunks: list[str] = transcript_chunks
+        self._transcript_chunks: Sequence[str] = transcript_chunks
 
     def get_chunks(
         self,
@@ -40,22 +47,142 @@ class VideoTranscript:
 
         """
         logger.debug(
-            f"Converting transcript into chunks of {token_limit} max tokens...",
+            "Converting transcript into chunks of {} max tokens...",
+            token_limit,
         )
-        transcript_str: str = ""
+        formatted_chunks: list[str] = [
+            chunk if i == 0 else " " + chunk
+            for i, chunk in enumerate(self._transcript_chunks)
+        ]
+        # Tokenize every line in a single batch call and keep a running count,
+        # rather than re-tokenizing the whole chunk built so far on every line.
+        chunk_token_counts: list[int] = tokenizer.count_tokens_batch(formatted_chunks)
+        # Lines are collected in a list and joined once per chunk instead of
+        # growing a string with repeated concatenation.
+        transcript_lines: list[str] = []
+        transcript_tokens: int = 0
+
+        for formatted_chunk, chunk_tokens in self._split_oversized_lines(
+            formatted_chunks,
+            chunk_token_counts,
+            token_limit,
+            tokenizer,
+        ):
+            # Only flush a non-empty chunk, otherwise a first line that is
+            # over the limit on its own would yield an empty chunk.
+            if transcript_lines and transcript_tokens + chunk_tokens >= token_limit:
+                logger.debug("Adding chunk: {}", formatted_chunk)
+                yield "".join(transcript_lines)
+                transcript_lines.clear()
+                transcript_tokens = 0
+
+            transcript_lines.append(formatted_chunk)
+            transcript_tokens += chunk_tokens
+
+        transcript_str: str = "".join(transcript_lines)
 
-        for i, chunk in enumerate(self._transcript_chunks):
-            formatted_chunk: str = chunk if i == 0 else " " + chunk
-            tokens: int = tokenizer.count_tokens(transcript_str + formatted_chunk)
+        if transcript_str:
+            logger.debug("Adding last chunk: {}", transcript_str)
+            yield transcript_str
 
-            if tokens >= token_limit:
-                logger.debug(f"Adding chunk: {formatted_chunk}")
-                yield transcript_str
-                transcript_str = ""
+    @staticmethod
+    def _split_oversized_lines(
+        lines: list[str],
+        line_token_counts: list[int],
+        token_limit: int,
+        tokenizer: Tokenizer,
+    ) -> Generator[tuple[str, int], None, None]:
+        """Split lines that do not fit in a chunk at sentence or word boundaries.
 
-            transcript_str += formatted_chunk
+        Oversized lines are split into runs of whole sentences, and sentences that
+        still do not fit are split into runs of whole words, so no chunk sent to
+        the API is over the limit. Lines that fit are yielded unchanged.
 
-        if transcript_str:
-            logger.debug(f"Adding last chunk: {transcript_str}")
-            yield transcript_str
-            transcript_str = ""
+        Args:
+        ----
+            lines: The formatted transcript lines.
+            line_token_counts: The number of tokens in each line.
+            token_limit: The maximum number of tokens in each chunk.
+            tokenizer: The tokenizer to use.
+
+        Returns:
+        -------
+            A generator of each line or line piece and its number of tokens.
+
+        """
+        for line, line_tokens in zip(lines, line_token_counts, strict=True):
+            if line_tokens < token_limit:
+                yield line, line_tokens
+                continue
+
+            for piece, piece_tokens in _pack_parts(
+                _SENTENCE_BREAK_RE.split(line),
+                token_limit,
+                tokenizer,
+            ):
+                if piece_tokens < token_limit:
+                    yield piece, piece_tokens
+                    continue
+
+                for word_piece, word_piece_tokens in _pack_parts(
+                    _WORD_BREAK_RE.split(piece),
+                    token_limit,
+                    tokenizer,
+                ):
+                    if word_piece_tokens >= token_limit:
+                        logger.warning(
+                            "Transcript word with {} tokens does not fit in a chunk "
+                            "of {} max tokens.",
+                            word_piece_tokens,
+                            token_limit,
+                        )
+
+                    yield word_piece, word_piece_tokens
+
+
+def _pack_parts(
+    parts: list[str],
+    token_limit: int,
+    tokenizer: Tokenizer,
+) -> Generator[tuple[str, int], None, None]:
+    """Join consecutive parts of a line into pieces below a token limit.
+
+    The longest run of parts that fits is found with a binary search, so only a
+    logarithmic number of candidates is tokenized per piece.
+
+    Args:
+    ----
+        parts: The parts of the line, split at whitespace.
+        token_limit: The maximum number of tokens in each piece.
+        tokenizer: The tokenizer to use.
+
+    Returns:
+    -------
+        A generator of each piece and its number of tokens.
+
+    """
+    start = 0
+
+    while start < len(parts):
+        # Find the largest end where parts[start:end] fits, always taking at least
+        # one part.
+        low, high = start + 1, len(parts)
+
+        while low < high:
+            middle: int = (low + high + 1) // 2
+            candidate: str = " ".join(parts[start:middle])
+
+            if tokenizer.count_tokens(candidate) < token_limit:
+                low = middle
+            else:
+                high = middle - 1
+
+        piece: str = " ".join(parts[start:low])
+
+        # Later pieces are separated from the previous one by a space, like every
+        # transcript line after the first.
+        if start > 0:
+            piece = " " + piece
+
+        yield piece, tokenizer.count_tokens(piece)
+        start = low
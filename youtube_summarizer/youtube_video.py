@@ -1,5 +1,17 @@
+import re
+
 from youtube_summarizer.utils.url_parser import URLParser
 
+# Matches the watch, short link, embed and Shorts URL forms so the common cases are
+# resolved with a single precompiled match. Other URLs fall back to the generic
+# query string scan.
+_VIDEO_URL_RE: re.Pattern[str] = re.compile(
+    r"https://(?:"
+    r"(?:www\.|m\.)?youtube\.com/(?:watch\?(?:[^#]*?&)?v=|embed/|shorts/)"
+    r"|youtu\.be/"
+    r")([\w-]+)",
+)
+
 
 class YouTubeVideo:
 
@@ -21,13 +33,16 @@ class YouTubeVideo:
 
         if not video_url_or_id.startswith("https"):
             self.id: str = video_url_or_id
-        else:
-            parsed_url = URLParser(url=video_url_or_id)
-            query_string_dict: dict = parsed_url.query_string_dict()
+            return
+
+        match: re.Match[str] | None = _VIDEO_URL_RE.match(video_url_or_id)
+        video_id: str | None = (
+            match.group(1) if match else URLParser(url=video_url_or_id).video_id()
+        )
 
-            if "v" not in query_string_dict:
-                raise ValueError(
-                    "The video URL is malformed. Expected 'v' in query string.",
-                )
+        if video_id is None:
+            raise ValueError(
+                "The video URL is malformed. Expected 'v' in query string.",
+            )
 
-            self.id = query_string_dict["v"]
+        self.id = video_id
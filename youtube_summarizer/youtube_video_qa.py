@@ -1,21 +1,22 @@
-from typing import TYPE_CHECKING, NamedTuple
+import asyncio
+from collections.abc import Generator
+from typing import NamedTuple
 
-import tiktoken
 from loguru import logger
 
 from youtube_summarizer.clients.openai_client import OpenAIClient
 from youtube_summarizer.clients.youtube_transcript_client import YouTubeTranscriptClient
 from youtube_summarizer.types.video_usage_meta import VideoUsageMeta
-from youtube_summarizer.utils.tokenizer import Tokenizer
+from youtube_summarizer.utils import model_limits
+from youtube_summarizer.utils.constants import DEFAULT_MAX_CONCURRENCY
+from youtube_summarizer.utils.model_limits import get_model_token_limit
+from youtube_summarizer.utils.tokenizer import Tokenizer, get_tokenizer
+from youtube_summarizer.video_transcript import VideoTranscript
 from youtube_summarizer.youtube_video import YouTubeVideo
 
-if TYPE_CHECKING:
-    from collections.abc import Generator
-
-    from youtube_summarizer.video_transcript import VideoTranscript
-
-GPT_35_TURBO_TOKEN_LIMIT = 4096
-GPT_4O_MINI_TOKEN_LIMIT = 128000
+# Public since before the per-model limits, see utils.model_limits.
+GPT_35_TURBO_TOKEN_LIMIT = model_limits.GPT_35_TURBO_TOKEN_LIMIT
+GPT_4O_MINI_TOKEN_LIMIT = model_limits.GPT_4O_MINI_TOKEN_LIMIT
 
 ANSWER_NOT_FOUND = "ANSWER_NOT_FOUND"
 
@@ -53,7 +54,8 @@ class YouTubeVideoQA:
         openai_client: OpenAIClient,
         *,
         model_name="gpt-4o-mini-2024-07-18",
-        token_limit=GPT_4O_MINI_TOKEN_LIMIT,
+        token_limit: int | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> None:
         """Initialize the YouTubeVideoSummarizer instance.
 
@@ -62,15 +64,31 @@ class YouTubeVideoQA:
           openai_client: The OpenAI API client.
           model_name: The chat completion model to use for summarization.
           token_limit: The maximum number of tokens to use for summarization.
+            Defaults to the context length of the model.
+          max_concurrency: The maximum number of chunks to check at once when
+            answering asynchronously.
 
         """
+        if max_concurrency < 1:
+            raise ValueError("Expected max_concurrency to be at least 1.")
+
         self._openai_client: OpenAIClient = openai_client
-        self._tokenizer = Tokenizer(tiktoken.encoding_for_model(model_name))
+        self._tokenizer: Tokenizer = get_tokenizer(model_name)
         self._model_name: str = model_name
+
+        if token_limit is None:
+            token_limit = get_model_token_limit(model_name)
+
         self._system_prompt: str = QA_SYSTEM_PROMPT
         self._token_limit: int = token_limit - self._tokenizer.count_tokens(
             self._system_prompt
         )
+        # The chunk prompt template is fixed, so count its tokens once and only
+        # count the question per call.
+        self._chunk_prompt_template_tokens: int = self._tokenizer.count_tokens(
+            QA_CHUNK_PROMPT.format(chunk="", question="")
+        )
+        self._max_concurrency: int = max_concurrency
 
     def answer_question(
         self,
@@ -95,22 +113,14 @@ class YouTubeVideoQA:
           None if no answer is found.
 
         """
-        logger.debug(f"Answering question with video {youtube_video.id}...")
+        logger.debug("Answering question with video {}...", youtube_video.id)
         transcript: VideoTranscript = YouTubeTranscriptClient.get_transcript(
             video_id=youtube_video.id,
         )
-        chunk_prompt_tokens: int = self._tokenizer.count_tokens(
-            QA_CHUNK_PROMPT.format(
-                chunk="",
-                question=question,
-            )
-        )
-        chunk_prompt_tokens_remaining: int = (
-            self._token_limit - chunk_prompt_tokens - min_new_tokens
-        )
-        transcript_chunks: Generator[str, None, None] = transcript.get_chunks(
-            chunk_prompt_tokens_remaining,
-            self._tokenizer,
+        transcript_chunks: Generator[str, None, None] = self._get_transcript_chunks(
+            transcript,
+            question,
+            min_new_tokens=min_new_tokens,
         )
         prompt_tokens = 0
         completion_tokens = 0
@@ -123,12 +133,12 @@ class YouTubeVideoQA:
                 temperature=temperature,
             )
 
-            logger.debug(f"Usage: {usage}")
+            logger.debug("Usage: {}", usage)
             prompt_tokens += usage["prompt_tokens"]
             completion_tokens += usage["completion_tokens"]
 
             if answer:
-                logger.debug(f"Found answer: {answer}")
+                logger.debug("Found answer: {}", answer)
 
                 return VideoQAResponse(
                     video_id=youtube_video.id,
@@ -150,6 +160,121 @@ class YouTubeVideoQA:
             ),
         )
 
+    async def answer_question_async(
+        self,
+        youtube_video: YouTubeVideo,
+        question: str,
+        *,
+        temperature: float = 0.1,
+        min_new_tokens: int = 100,
+    ) -> VideoQAResponse:
+        """Ask a question about a YouTube video and get an answer if one exists.
+
+        Every chunk is checked concurrently and the first answer to come back is
+        returned, cancelling the checks that are still pending. When several chunks
+        contain an answer, the one returned may not be the earliest in the video.
+
+        Args:
+        ----
+          youtube_video: The URL of the video to summarize.
+          question: The question to ask.
+          temperature: The temperature to use for the model.
+          min_new_tokens: The minimum number of tokens to allow for a response.
+
+        Returns:
+        -------
+          An object containing the answer and meta information. The answer is
+          None if no answer is found.
+
+        """
+        logger.debug("Answering question async with video {}...", youtube_video.id)
+        # Fetching the transcript is a blocking network call, so run it in a thread
+        # to keep the event loop free for other work.
+        transcript: VideoTranscript = await asyncio.to_thread(
+            YouTubeTranscriptClient.get_transcript,
+            video_id=youtube_video.id,
+        )
+        transcript_chunks: Generator[str, None, None] = self._get_transcript_chunks(
+            transcript,
+            question,
+            min_new_tokens=min_new_tokens,
+        )
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def check_chunk(chunk: str) -> tuple[str | None, dict]:
+            async with semaphore:
+                return await self._check_chunk_for_answer_async(
+                    chunk=chunk,
+                    question=question,
+                    model=self._model_name,
+                    temperature=temperature,
+                )
+
+        tasks: list[asyncio.Task] = [
+            asyncio.create_task(check_chunk(chunk)) for chunk in transcript_chunks
+        ]
+        answer: str | None = None
+        prompt_tokens = 0
+        completion_tokens = 0
+
+        try:
+            for completed_task in asyncio.as_completed(tasks):
+                answer, usage = await completed_task
+
+                logger.debug("Usage: {}", usage)
+                prompt_tokens += usage["prompt_tokens"]
+                completion_tokens += usage["completion_tokens"]
+
+                if answer:
+                    logger.debug("Found answer: {}", answer)
+                    break
+        finally:
+            # Stop checking the remaining chunks once an answer is found or a
+            # check fails.
+            for task in tasks:
+                task.cancel()
+
+        return VideoQAResponse(
+            video_id=youtube_video.id,
+            question=question,
+            answer=answer,
+            meta=VideoUsageMeta(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+            ),
+        )
+
+    def _get_transcript_chunks(
+        self,
+        transcript: VideoTranscript,
+        question: str,
+        *,
+        min_new_tokens: int,
+    ) -> Generator[str, None, None]:
+        """Return the transcript chunks that fit in a prompt with the question.
+
+        Args:
+        ----
+          transcript: The transcript to split into chunks.
+          question: The question the chunks will be sent with.
+          min_new_tokens: The minimum number of tokens to allow for a response.
+
+        Returns:
+        -------
+          A generator of transcript chunks.
+
+        """
+        chunk_prompt_tokens: int = (
+            self._chunk_prompt_template_tokens + self._tokenizer.count_tokens(question)
+        )
+        chunk_prompt_tokens_remaining: int = (
+            self._token_limit - chunk_prompt_tokens - min_new_tokens
+        )
+        return transcript.get_chunks(
+            chunk_prompt_tokens_remaining,
+            self._tokenizer,
+        )
+
     def _check_chunk_for_answer(
         self,
         chunk: str,
@@ -172,7 +297,7 @@ class YouTubeVideoQA:
           The answer found or None if no answer is found.
 
         """
-        logger.debug(f"Trying to answer question with chunk using model {model}...")
+        logger.debug("Trying to answer question with chunk using model {}...", model)
 
         prompt = QA_CHUNK_PROMPT.format(
             chunk=chunk,
@@ -189,3 +314,46 @@ class YouTubeVideoQA:
             return None, usage
 
         return response["content"], usage
+
+    async def _check_chunk_for_answer_async(
+        self,
+        chunk: str,
+        question: str,
+        model: str,
+        *,
+        temperature: float = 0.1,
+    ) -> tuple[str | None, dict]:
+        """Answer a question about a chunk of text.
+
+        Args:
+        ----
+          chunk: The chunk of text to summarize.
+          question: The question to ask.
+          model: The model to use for the API.
+          temperature: The temperature to use for the model.
+
+        Returns:
+        -------
+          The answer found or None if no answer is found.
+
+        """
+        logger.debug(
+            "Trying to answer question async with chunk using model {}...",
+            model,
+        )
+
+        prompt = QA_CHUNK_PROMPT.format(
+            chunk=chunk,
+            question=question,
+        )
+        response, usage = await self._openai_client.generate_chat_completion_async(
+            user_prompt=prompt,
+            model=model,
+            temperature=temperature,
+            system_prompt=self._system_prompt,
+        )
+
+        if response["content"] == ANSWER_NOT_FOUND:
+            return None, usage
+
+        return response["content"], usage
@@ -1,14 +1,24 @@
 import asyncio
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import TYPE_CHECKING, NamedTuple
+from functools import partial
+from itertools import pairwise
+from typing import TYPE_CHECKING, ClassVar, NamedTuple
 
-import tiktoken
 from loguru import logger
 
-from youtube_summarizer.clients.openai_client import OpenAIClient
+from youtube_summarizer.clients.openai_client import ChatCompletionDelta, OpenAIClient
 from youtube_summarizer.clients.youtube_transcript_client import YouTubeTranscriptClient
 from youtube_summarizer.types.video_usage_meta import VideoUsageMeta
-from youtube_summarizer.utils.tokenizer import Tokenizer
+from youtube_summarizer.utils import model_limits
+from youtube_summarizer.utils.constants import DEFAULT_MAX_CONCURRENCY
+from youtube_summarizer.utils.model_limits import get_model_token_limit
+from youtube_summarizer.utils.rate_limiter import TokenRateLimiter
+from youtube_summarizer.utils.tokenizer import Tokenizer, get_tokenizer
 from youtube_summarizer.youtube_video import YouTubeVideo
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -16,8 +26,14 @@ if TYPE_CHECKING:  # pragma: no cover
 
     from youtube_summarizer.video_transcript import VideoTranscript
 
-GPT_35_TURBO_TOKEN_LIMIT = 4096
-GPT_4O_MINI_TOKEN_LIMIT = 128000
+# Defined in utils.model_limits, kept importable from here for existing callers.
+GPT_35_TURBO_TOKEN_LIMIT = model_limits.GPT_35_TURBO_TOKEN_LIMIT
+GPT_4O_MINI_TOKEN_LIMIT = model_limits.GPT_4O_MINI_TOKEN_LIMIT
+
+DEFAULT_MIN_NEW_TOKENS = 512
+
+# Matches the bullet marker at the start of each line of a summary.
+_BULLET_RE: re.Pattern[str] = re.compile(r"^[ \t]*[-*•][ \t]+", re.MULTILINE)
 
 SUMMARIZATION_SYSTEM_PROMPT = (
     "You are a YouTube summarizer bot. Summarize the provided content into "
@@ -48,6 +64,26 @@ class VideoSummarizationList(NamedTuple):
     meta: VideoUsageMeta
 
 
+class ChunkSummary(NamedTuple):
+
+    """The summary of a single transcript chunk."""
+
+    chunk_index: int
+    summary: str
+    usage: dict
+    # Set instead of the summary when the chunk failed and errors are returned.
+    error: Exception | None = None
+
+
+class SummaryDelta(NamedTuple):
+
+    """A piece of a streamed chunk summary."""
+
+    chunk_index: int
+    content: str
+    usage: dict | None = None
+
+
 class SummarizationOutputFormat(str, Enum):
 
     """The format to return the summary in."""
@@ -56,16 +92,80 @@ class SummarizationOutputFormat(str, Enum):
     LIST = "list"
 
 
-class YouTubeVideoSummarizer:
+def _get_system_prompt(*, detailed: bool) -> str:
+    """Return the system prompt to summarize chunks with.
+
+    Args:
+    ----
+      detailed: Whether to return detailed summaries.
+
+    Returns:
+    -------
+      The summarization system prompt.
+
+    """
+    if detailed:
+        return DETAILED_SUMMARIZATION_SYSTEM_PROMPT
+
+    return SUMMARIZATION_SYSTEM_PROMPT
 
-    """YouTube Video Summarizer."""
 
-    def __init__(
+def _parse_output_format(
+    output_format: SummarizationOutputFormat | str,
+) -> SummarizationOutputFormat:
+    """Coerce an output format value to a SummarizationOutputFormat.
+
+    Args:
+    ----
+      output_format: The output format or its string value.
+
+    Returns:
+    -------
+      The output format.
+
+    Raises:
+    ------
+      ValueError: If the output format is invalid.
+
+    """
+    try:
+        return SummarizationOutputFormat(output_format)
+    except ValueError:
+        raise ValueError(f"Invalid output format: {output_format}.") from None
+
+
+class YouTubeVideoSummarizer:
+
+    """YouTube Video Summarizer.
+
+    Instances hold no per-video state apart from the optional result cache, which is
+    guarded by a lock, so a single summarizer can be shared across threads and
+    requests instead of being rebuilt for every video.
+    """
+
+    __slots__ = (
+        "_openai_client",
+        "_tokenizer",
+        "_model_name",
+        "_max_concurrency",
+        "_rate_limiter",
+        "_chunk_token_limit",
+        "_detailed_chunk_token_limit",
+        "_max_cache_entries",
+        "_summarization_cache",
+        "_summarization_cache_lock",
+    )
+
+    def __init__(  # noqa: PLR0913
         self,
         openai_client: OpenAIClient,
         *,
         model_name="gpt-4o-mini-2024-07-18",
-        token_limit=GPT_4O_MINI_TOKEN_LIMIT,
+        token_limit: int | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        tokens_per_minute: int | None = None,
+        min_new_tokens: int = DEFAULT_MIN_NEW_TOKENS,
+        max_cache_entries: int = 0,
     ) -> None:
         """Initialize the YouTubeVideoSummarizer instance.
 
@@ -74,12 +174,59 @@ class YouTubeVideoSummarizer:
           openai_client: The OpenAI API client.
           model_name: The chat completion model to use for summarization.
           token_limit: The maximum number of tokens to use for summarization.
+            Defaults to the context length of the model.
+          max_concurrency: The maximum number of chunks to summarize at once.
+          tokens_per_minute: An optional limit on the prompt tokens sent per minute
+            by the async methods, to stay under the account's rate limit instead of
+            bursting into rate limit errors.
+          min_new_tokens: The number of tokens to leave free in the context for each
+            chunk summary.
+          max_cache_entries: The number of finished summaries to keep in memory,
+            keyed by video, output format, temperature and detail level. Repeated
+            calls are served without fetching the transcript or calling the API.
+            Disabled by default. Summaries are only reproducible at temperature 0,
+            so cached results may differ from what a new call would return.
 
         """
+        if max_concurrency < 1:
+            raise ValueError("Expected max_concurrency to be at least 1.")
+
         self._openai_client: OpenAIClient = openai_client
-        self._tokenizer = Tokenizer(tiktoken.encoding_for_model(model_name))
+        self._tokenizer: Tokenizer = get_tokenizer(model_name)
         self._model_name: str = model_name
-        self._token_limit: int = token_limit
+
+        if token_limit is None:
+            token_limit = get_model_token_limit(model_name)
+
+        # The system prompt and the response share the context with the chunk, so
+        # subtract them once here instead of when chunking every video.
+        self._chunk_token_limit: int = (
+            token_limit
+            - self._tokenizer.count_tokens(SUMMARIZATION_SYSTEM_PROMPT)
+            - min_new_tokens
+        )
+        self._detailed_chunk_token_limit: int = (
+            token_limit
+            - self._tokenizer.count_tokens(DETAILED_SUMMARIZATION_SYSTEM_PROMPT)
+            - min_new_tokens
+        )
+
+        if min(self._chunk_token_limit, self._detailed_chunk_token_limit) < 1:
+            raise ValueError(
+                "Expected token_limit to leave room for the system prompt, the "
+                "response and the transcript.",
+            )
+
+        self._max_concurrency: int = max_concurrency
+        self._max_cache_entries: int = max_cache_entries
+        self._summarization_cache: OrderedDict[
+            tuple,
+            VideoSummarizationBulletedList | VideoSummarizationList,
+        ] = OrderedDict()
+        self._summarization_cache_lock = threading.Lock()
+        self._rate_limiter: TokenRateLimiter | None = (
+            TokenRateLimiter(tokens_per_minute) if tokens_per_minute else None
+        )
 
     def summarize(
         self,
@@ -107,56 +254,71 @@ class YouTubeVideoSummarizer:
           ValueError: If the output format is invalid.
 
         """
-        if (
-            output_format not in SummarizationOutputFormat._value2member_map_  # noqa: SLF001
-        ):
-            raise ValueError(f"Invalid output format: {output_format}.")
+        output_format = _parse_output_format(output_format)
+        cache_key: tuple = (youtube_video.id, output_format, temperature, detailed)
+        cached_summarization = self._get_cached_summarization(cache_key)
 
-        logger.debug(f"Summarizing video {youtube_video.id}...")
+        if cached_summarization is not None:
+            return cached_summarization
+
+        logger.debug("Summarizing video {}...", youtube_video.id)
 
         transcript: VideoTranscript = YouTubeTranscriptClient.get_transcript(
             video_id=youtube_video.id,
         )
         transcript_chunks: Generator[str, None, None] = transcript.get_chunks(
-            self._token_limit,
+            self._get_chunk_token_limit(detailed=detailed),
             self._tokenizer,
         )
+        summarize_chunk = partial(
+            self._summarize_chunk,
+            model=self._model_name,
+            temperature=temperature,
+            system_prompt=_get_system_prompt(detailed=detailed),
+        )
+
         summaries: list[str] = []
         prompt_tokens = 0
         completion_tokens = 0
 
-        for chunk in transcript_chunks:
-            summary, usage = self._summarize_chunk(
-                chunk=chunk,
-                model=self._model_name,
-                temperature=temperature,
-                detailed=detailed,
-            )
-            logger.debug(f"Summarized chunk: {summary}")
-            logger.debug(f"Usage: {usage}")
-            summaries.append(summary)
-            prompt_tokens += usage["prompt_tokens"]
-            completion_tokens += usage["completion_tokens"]
+        # The OpenAI calls are I/O bound, so summarize the chunks on a thread pool
+        # instead of paying each round trip one after another. Results are
+        # accumulated as they are yielded in order, without collecting them first.
+        with ThreadPoolExecutor(max_workers=self._max_concurrency) as executor:
+            try:
+                for summary, usage in executor.map(summarize_chunk, transcript_chunks):
+                    logger.debug("Summarized chunk: {}", summary)
+                    logger.debug("Usage: {}", usage)
+                    summaries.append(summary)
+                    prompt_tokens += usage["prompt_tokens"]
+                    completion_tokens += usage["completion_tokens"]
+            except BaseException:
+                # Drop the chunks that have not started yet instead of paying for
+                # requests whose summaries will be discarded.
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
 
         meta_information = VideoUsageMeta(
             prompt_tokens=prompt_tokens,
             completion_tokens=completion_tokens,
         )
 
-        return self._get_formatted_summarization(
-            video_id=youtube_video.id,
-            meta_information=meta_information,
-            output_format=output_format,
-            summary_chunks=summaries,
+        summarization = self._FORMATTERS[output_format](
+            youtube_video.id,
+            summaries,
+            meta_information,
         )
+        self._cache_summarization(cache_key, summarization)
+        return summarization
 
-    async def summarize_async(
+    async def summarize_async(  # noqa: PLR0913
         self,
         youtube_video: YouTubeVideo,
         *,
         output_format: SummarizationOutputFormat | str = SummarizationOutputFormat.LIST,
         temperature: float = 0.1,
         detailed: bool = False,
+        allow_partial: bool = False,
     ) -> VideoSummarizationBulletedList | VideoSummarizationList:
         """Summarize a YouTube video.
 
@@ -166,6 +328,9 @@ class YouTubeVideoSummarizer:
           output_format: The format to return the summary in.
           temperature: The temperature to use for the model.
           detailed: Whether to return detailed summaries.
+          allow_partial: Whether to leave failed chunks out of the summary instead
+            of failing the whole video. The number of failed chunks is reported in
+            the meta information and partial summaries are not cached.
 
         Returns:
         -------
@@ -176,97 +341,480 @@ class YouTubeVideoSummarizer:
           ValueError: If the output format is invalid.
 
         """
-        if (
-            output_format not in SummarizationOutputFormat._value2member_map_  # noqa: SLF001
+        output_format = _parse_output_format(output_format)
+        cache_key: tuple = (youtube_video.id, output_format, temperature, detailed)
+        cached_summarization = self._get_cached_summarization(cache_key)
+
+        if cached_summarization is not None:
+            return cached_summarization
+
+        logger.debug("Summarizing video {}...", youtube_video.id)
+
+        summary_chunks: list[str] = []
+        errors: list[Exception] = []
+        prompt_tokens = 0
+        completion_tokens = 0
+
+        async for chunk_summary in self.summarize_stream_async(
+            youtube_video,
+            temperature=temperature,
+            detailed=detailed,
+            return_exceptions=allow_partial,
         ):
-            raise ValueError(f"Invalid output format: {output_format}.")
+            if chunk_summary.error is not None:
+                errors.append(chunk_summary.error)
+                continue
 
-        logger.debug(f"Summarizing video {youtube_video.id}...")
+            logger.debug('Summary: "{}"', chunk_summary.summary)
+            summary_chunks.append(chunk_summary.summary)
+            prompt_tokens += chunk_summary.usage["prompt_tokens"]
+            completion_tokens += chunk_summary.usage["completion_tokens"]
 
-        transcript: VideoTranscript = YouTubeTranscriptClient.get_transcript(
+        # A summary without any chunk is not a partial success.
+        if errors and not summary_chunks:
+            raise errors[0]
+
+        meta_information = VideoUsageMeta(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            failed_chunks=len(errors),
+        )
+        summarization = self._FORMATTERS[output_format](
+            youtube_video.id,
+            summary_chunks,
+            meta_information,
+        )
+
+        if not errors:
+            self._cache_summarization(cache_key, summarization)
+
+        return summarization
+
+    async def summarize_stream_async(  # noqa: PLR0913
+        self,
+        youtube_video: YouTubeVideo,
+        *,
+        temperature: float = 0.1,
+        detailed: bool = False,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+    ) -> AsyncGenerator[ChunkSummary, None]:
+        """Summarize a YouTube video, yielding chunk summaries as they complete.
+
+        Chunks are summarized concurrently. By default each summary is yielded as
+        soon as it and every summary before it are done, so the first results are
+        available without waiting for the whole video. With ordered set to False,
+        summaries are yielded as soon as they complete and callers can use their
+        chunk_index to put them back in order.
+
+        Args:
+        ----
+          youtube_video: The URL of the video to summarize.
+          temperature: The temperature to use for the model.
+          detailed: Whether to return detailed summaries.
+          ordered: Whether to yield the summaries in transcript order.
+          return_exceptions: Whether to yield failed chunks with their error set
+            instead of raising the error and cancelling the other chunks.
+
+        Returns:
+        -------
+          An async generator of the summary of each chunk.
+
+        """
+        logger.debug("Streaming summary of video {}...", youtube_video.id)
+
+        # Fetching the transcript is a blocking network call, so run it in a thread
+        # to keep the event loop free for other work.
+        transcript: VideoTranscript = await asyncio.to_thread(
+            YouTubeTranscriptClient.get_transcript,
             video_id=youtube_video.id,
         )
         transcript_chunks: Generator[str, None, None] = transcript.get_chunks(
-            self._token_limit,
+            self._get_chunk_token_limit(detailed=detailed),
             self._tokenizer,
         )
-        tasks: list[asyncio.Task] = []
+        system_prompt: str = _get_system_prompt(detailed=detailed)
+        semaphore = asyncio.Semaphore(self._max_concurrency)
 
-        for chunk in transcript_chunks:
-            tasks.append(
-                asyncio.create_task(
-                    self._summarize_chunk_async(
+        async def summarize_chunk(index: int, chunk: str) -> ChunkSummary:
+            try:
+                async with semaphore:
+                    summary, usage = await self._summarize_chunk_async(
                         chunk=chunk,
                         model=self._model_name,
                         temperature=temperature,
-                        detailed=detailed,
-                    ),
-                ),
-            )
+                        system_prompt=system_prompt,
+                    )
+            except Exception as error:  # noqa: BLE001
+                if not return_exceptions:
+                    raise
+
+                logger.warning("Failed to summarize chunk {}: {}", index, error)
+                return ChunkSummary(
+                    chunk_index=index,
+                    summary="",
+                    usage={"prompt_tokens": 0, "completion_tokens": 0},
+                    error=error,
+                )
+
+            return ChunkSummary(chunk_index=index, summary=summary, usage=usage)
 
-        results: list[tuple[str, dict]] = await asyncio.gather(*tasks)
-        prompt_tokens = 0
-        completion_tokens = 0
-        summary_chunks: list[str] = []
+        tasks: list[asyncio.Task] = []
+
+        try:
+            for index, chunk in enumerate(transcript_chunks):
+                tasks.append(asyncio.create_task(summarize_chunk(index, chunk)))
+                # Yield to the event loop so the request for this chunk is sent
+                # while the next chunks are still being built.
+                await asyncio.sleep(0)
+
+            # Completed results wait in their slot until every earlier chunk is
+            # done, then the completed prefix is flushed in order.
+            slots: list[ChunkSummary | None] = [None] * len(tasks)
+            next_index = 0
+
+            for completed_task in asyncio.as_completed(tasks):
+                chunk_summary: ChunkSummary = await completed_task
+
+                if not ordered:
+                    yield chunk_summary
+                    continue
+
+                slots[chunk_summary.chunk_index] = chunk_summary
+
+                while next_index < len(slots) and slots[next_index] is not None:
+                    yield slots[next_index]  # type: ignore[misc]
+                    slots[next_index] = None
+                    next_index += 1
+        finally:
+            # Stop summarizing if the caller stops consuming early, a chunk fails
+            # or the transcript cannot be chunked.
+            for task in tasks:
+                task.cancel()
+
+    async def summarize_deltas_async(
+        self,
+        youtube_video: YouTubeVideo,
+        *,
+        temperature: float = 0.1,
+        detailed: bool = False,
+    ) -> AsyncGenerator[SummaryDelta, None]:
+        """Summarize a YouTube video, yielding the summary text as it is generated.
 
-        for result in results:
-            summaries, usage_dict = result
-            prompt_tokens += usage_dict["prompt_tokens"]
-            completion_tokens += usage_dict["completion_tokens"]
-            logger.debug(f'Summary: "{summaries}"')
-            summary_chunks.append(summaries)
+        Chunks are summarized concurrently, but deltas are yielded in transcript
+        order. The deltas of the earliest unfinished chunk are yielded as they
+        arrive and later chunks are buffered until it is done, so the first words
+        of the summary are available after the first generated token.
 
-        meta_information = VideoUsageMeta(
-            prompt_tokens=prompt_tokens,
-            completion_tokens=completion_tokens,
-        )
-        return self._get_formatted_summarization(
+        Args:
+        ----
+          youtube_video: The URL of the video to summarize.
+          temperature: The temperature to use for the model.
+          detailed: Whether to return detailed summaries.
+
+        Returns:
+        -------
+          An async generator of summary deltas. The last delta of each chunk
+          carries the usage of that chunk.
+
+        """
+        logger.debug("Streaming summary deltas of video {}...", youtube_video.id)
+
+        transcript: VideoTranscript = await asyncio.to_thread(
+            YouTubeTranscriptClient.get_transcript,
             video_id=youtube_video.id,
-            summary_chunks=summary_chunks,
-            meta_information=meta_information,
-            output_format=output_format,
         )
+        transcript_chunks: Generator[str, None, None] = transcript.get_chunks(
+            self._get_chunk_token_limit(detailed=detailed),
+            self._tokenizer,
+        )
+        system_prompt: str = _get_system_prompt(detailed=detailed)
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def stream_chunk(
+            index: int,
+            chunk: str,
+            queue: asyncio.Queue[SummaryDelta | None],
+        ) -> None:
+            try:
+                async with semaphore:
+                    async for delta in self._stream_summarize_chunk_async(
+                        chunk=chunk,
+                        model=self._model_name,
+                        temperature=temperature,
+                        system_prompt=system_prompt,
+                    ):
+                        queue.put_nowait(
+                            SummaryDelta(
+                                chunk_index=index,
+                                content=delta.content,
+                                usage=delta.usage,
+                            ),
+                        )
+            finally:
+                # Mark the end of the chunk, the task result reports any error.
+                queue.put_nowait(None)
+
+        queues: list[asyncio.Queue[SummaryDelta | None]] = []
+        tasks: list[asyncio.Task] = []
+
+        try:
+            for index, chunk in enumerate(transcript_chunks):
+                queue: asyncio.Queue[SummaryDelta | None] = asyncio.Queue()
+                queues.append(queue)
+                tasks.append(asyncio.create_task(stream_chunk(index, chunk, queue)))
+                await asyncio.sleep(0)
+
+            for task, queue in zip(tasks, queues, strict=True):
+                while (summary_delta := await queue.get()) is not None:
+                    yield summary_delta
+
+                await task
+        finally:
+            for task in tasks:
+                task.cancel()
 
-    def _get_formatted_summarization(
+    def summarize_batch(
         self,
-        video_id: str,
-        summary_chunks: list[str],
-        meta_information: VideoUsageMeta,
-        output_format: SummarizationOutputFormat | str,
+        youtube_video: YouTubeVideo,
+        *,
+        output_format: SummarizationOutputFormat | str = SummarizationOutputFormat.LIST,
+        temperature: float = 0.1,
+        detailed: bool = False,
     ) -> VideoSummarizationBulletedList | VideoSummarizationList:
-        if output_format == SummarizationOutputFormat.BULLETED_LIST:
-            summary_str: str = "\n".join(summary_chunks)
+        """Summarize a YouTube video with the OpenAI Batch API.
 
-            return VideoSummarizationBulletedList(
-                video_id=video_id,
-                summary=summary_str,
-                meta=meta_information,
+        Batch requests cost less than regular requests but can take up to 24 hours
+        to complete, so this is meant for non-interactive runs.
+
+        Args:
+        ----
+          youtube_video: The URL of the video to summarize.
+          output_format: The format to return the summary in.
+          temperature: The temperature to use for the model.
+          detailed: Whether to return detailed summaries.
+
+        Returns:
+        -------
+          An object containing the summary and meta information.
+
+        Raises:
+        ------
+          ValueError: If the output format is invalid.
+
+        """
+        return self.summarize_bulk(
+            [youtube_video],
+            output_format=output_format,
+            temperature=temperature,
+            detailed=detailed,
+        )[0]
+
+    def summarize_bulk(
+        self,
+        youtube_videos: Sequence[YouTubeVideo],
+        *,
+        output_format: SummarizationOutputFormat | str = SummarizationOutputFormat.LIST,
+        temperature: float = 0.1,
+        detailed: bool = False,
+    ) -> list[VideoSummarizationBulletedList | VideoSummarizationList]:
+        """Summarize several YouTube videos in a single OpenAI Batch API job.
+
+        The chunks of every video are submitted together, so summarizing a playlist
+        costs one batch job instead of one per video.
+
+        Args:
+        ----
+          youtube_videos: The videos to summarize.
+          output_format: The format to return the summaries in.
+          temperature: The temperature to use for the model.
+          detailed: Whether to return detailed summaries.
+
+        Returns:
+        -------
+          An object containing the summary and meta information for each video, in
+          the order the videos were given.
+
+        Raises:
+        ------
+          ValueError: If the output format is invalid.
+
+        """
+        output_format = _parse_output_format(output_format)
+
+        transcript_chunks: list[str] = []
+        # The index of the first chunk of each video, plus the total at the end, so
+        # each video's results can be sliced back out of the batch.
+        chunk_offsets: list[int] = [0]
+
+        for youtube_video in youtube_videos:
+            logger.debug("Summarizing video {} in a batch...", youtube_video.id)
+
+            transcript: VideoTranscript = YouTubeTranscriptClient.get_transcript(
+                video_id=youtube_video.id,
             )
+            transcript_chunks.extend(
+                transcript.get_chunks(
+                    self._get_chunk_token_limit(detailed=detailed),
+                    self._tokenizer,
+                ),
+            )
+            chunk_offsets.append(len(transcript_chunks))
 
-        summary_list: list[str] = []
+        system_prompt: str = _get_system_prompt(detailed=detailed)
+        results = self._openai_client.generate_chat_completions_batch(
+            transcript_chunks,
+            model=self._model_name,
+            temperature=temperature,
+            system_prompt=system_prompt,
+        )
+        summarizations: list[VideoSummarizationBulletedList | VideoSummarizationList]
+        summarizations = []
 
-        for chunk in summary_chunks:
-            summary_list.extend(
-                [
-                    chunk[2:] if chunk.startswith("- ") else chunk
-                    for chunk in chunk.split("\n")
-                    if chunk
-                ],
+        for youtube_video, (start, end) in zip(
+            youtube_videos,
+            pairwise(chunk_offsets),
+            strict=True,
+        ):
+            summaries: list[str] = []
+            prompt_tokens = 0
+            completion_tokens = 0
+
+            for response, usage in results[start:end]:
+                summaries.append(response["content"])
+                prompt_tokens += usage["prompt_tokens"]
+                completion_tokens += usage["completion_tokens"]
+
+            meta_information = VideoUsageMeta(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+            )
+            summarizations.append(
+                self._FORMATTERS[output_format](
+                    youtube_video.id,
+                    summaries,
+                    meta_information,
+                ),
             )
 
+        return summarizations
+
+    def _get_cached_summarization(
+        self,
+        cache_key: tuple,
+    ) -> VideoSummarizationBulletedList | VideoSummarizationList | None:
+        """Get a cached summarization and mark it as recently used.
+
+        Args:
+        ----
+          cache_key: The cache key of the summarization.
+
+        Returns:
+        -------
+          The cached summarization or None if it is not cached.
+
+        """
+        with self._summarization_cache_lock:
+            summarization = self._summarization_cache.get(cache_key)
+
+            if summarization is not None:
+                self._summarization_cache.move_to_end(cache_key)
+
+        return summarization
+
+    def _cache_summarization(
+        self,
+        cache_key: tuple,
+        summarization: VideoSummarizationBulletedList | VideoSummarizationList,
+    ) -> None:
+        """Cache a summarization, evicting the least recently used if full.
+
+        Args:
+        ----
+          cache_key: The cache key of the summarization.
+          summarization: The summarization to cache.
+
+        """
+        if self._max_cache_entries < 1:
+            return
+
+        with self._summarization_cache_lock:
+            self._summarization_cache[cache_key] = summarization
+            self._summarization_cache.move_to_end(cache_key)
+
+            while len(self._summarization_cache) > self._max_cache_entries:
+                self._summarization_cache.popitem(last=False)
+
+    def _get_chunk_token_limit(self, *, detailed: bool) -> int:
+        """Get the maximum number of tokens in a transcript chunk.
+
+        Args:
+        ----
+          detailed: Whether the chunks will be summarized in detail.
+
+        Returns:
+        -------
+          The token limit of each chunk.
+
+        """
+        if detailed:
+            return self._detailed_chunk_token_limit
+
+        return self._chunk_token_limit
+
+    @staticmethod
+    def _format_bulleted_list(
+        video_id: str,
+        summary_chunks: list[str],
+        meta_information: VideoUsageMeta,
+    ) -> VideoSummarizationBulletedList:
+        return VideoSummarizationBulletedList(
+            video_id=video_id,
+            summary="\n".join(summary_chunks),
+            meta=meta_information,
+        )
+
+    @staticmethod
+    def _format_list(
+        video_id: str,
+        summary_chunks: list[str],
+        meta_information: VideoUsageMeta,
+    ) -> VideoSummarizationList:
+        summary_list: list[str] = [
+            line
+            for chunk in summary_chunks
+            for line in _BULLET_RE.sub("", chunk).splitlines()
+            if line
+        ]
+
         return VideoSummarizationList(
             video_id=video_id,
             summary=summary_list,
             meta=meta_information,
         )
 
+    # Staticmethod objects are callable, so the formatters can be looked up by
+    # output format and called without an if/else chain.
+    _FORMATTERS: ClassVar[
+        dict[
+            SummarizationOutputFormat,
+            Callable[
+                [str, list[str], VideoUsageMeta],
+                VideoSummarizationBulletedList | VideoSummarizationList,
+            ],
+        ]
+    ] = {
+        SummarizationOutputFormat.BULLETED_LIST: _format_bulleted_list,
+        SummarizationOutputFormat.LIST: _format_list,
+    }
+
     def _summarize_chunk(
         self,
         chunk: str,
         model: str,
         *,
         temperature: float = 0.1,
-        detailed: bool = False,
+        system_prompt: str = SUMMARIZATION_SYSTEM_PROMPT,
     ) -> tuple[str, dict]:
         """Summarize a chunk of text.
 
@@ -275,20 +823,15 @@ class YouTubeVideoSummarizer:
           chunk: The chunk of text to summarize.
           model: The model to use for the API.
           temperature: The temperature to use for the model.
-          detailed: Whether to return detailed summaries.
+          system_prompt: The system prompt to summarize with.
 
         Returns:
         -------
           The summarized chunk and usage.
 
         """
-        logger.debug(f"Summarizing chunk with model {model}...")
+        logger.debug("Summarizing chunk with model {}...", model)
 
-        system_prompt: str = (
-            DETAILED_SUMMARIZATION_SYSTEM_PROMPT
-            if detailed
-            else SUMMARIZATION_SYSTEM_PROMPT
-        )
         response, usage = self._openai_client.generate_chat_completion(
             user_prompt=chunk,
             model=model,
@@ -304,7 +847,7 @@ class YouTubeVideoSummarizer:
         model: str,
         *,
         temperature: float = 0.1,
-        detailed: bool = False,
+        system_prompt: str = SUMMARIZATION_SYSTEM_PROMPT,
     ) -> tuple[str, dict]:
         """Summarize a chunk of text.
 
@@ -313,20 +856,21 @@ class YouTubeVideoSummarizer:
           chunk: The chunk of text to summarize.
           model: The model to use for the API.
           temperature: The temperature to use for the model.
-          detailed: Whether to return detailed summaries.
+          system_prompt: The system prompt to summarize with.
 
         Returns:
         -------
           The summarized chunk and usage.
 
         """
-        logger.debug(f"Summarizing chunk async with model {model}...")
+        logger.debug("Summarizing chunk async with model {}...", model)
+
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(
+                self._tokenizer.count_tokens(system_prompt)
+                + self._tokenizer.count_tokens(chunk),
+            )
 
-        system_prompt: str = (
-            DETAILED_SUMMARIZATION_SYSTEM_PROMPT
-            if detailed
-            else SUMMARIZATION_SYSTEM_PROMPT
-        )
         response, usage = await self._openai_client.generate_chat_completion_async(
             user_prompt=chunk,
             model=model,
@@ -335,3 +879,41 @@ class YouTubeVideoSummarizer:
         )
 
         return response["content"], usage
+
+    async def _stream_summarize_chunk_async(
+        self,
+        chunk: str,
+        model: str,
+        *,
+        temperature: float = 0.1,
+        system_prompt: str = SUMMARIZATION_SYSTEM_PROMPT,
+    ) -> AsyncGenerator[ChatCompletionDelta, None]:
+        """Summarize a chunk of text, yielding the summary as it is generated.
+
+        Args:
+        ----
+          chunk: The chunk of text to summarize.
+          model: The model to use for the API.
+          temperature: The temperature to use for the model.
+          system_prompt: The system prompt to summarize with.
+
+        Returns:
+        -------
+          An async generator of the summary deltas, the last one carrying usage.
+
+        """
+        logger.debug("Streaming chunk summary with model {}...", model)
+
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(
+                self._tokenizer.count_tokens(system_prompt)
+                + self._tokenizer.count_tokens(chunk),
+            )
+
+        async for delta in self._openai_client.stream_chat_completion_async(
+            user_prompt=chunk,
+            model=model,
+            temperature=temperature,
+            system_prompt=system_prompt,
+        ):
+            yield delta